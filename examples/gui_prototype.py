@@ -46,7 +46,7 @@ DEVELOPER NOTES FOR AGENT 3:
     1. Syntax Check: Ensure file compiles without syntax errors
     2. Import Check: Verify unified_theming modules can be imported
     3. Structure Check: Validate required classes and methods exist
-    4. Threading Check: Confirm proper threading with daemon=True
+    4. Threading Check: Confirm background work runs on the shared executor
     5. Error Handling: Verify try/except blocks for robustness
 
     Known Limitations:
@@ -78,11 +78,16 @@ import gi
 gi.require_version("Gtk", "4.0")  # type: ignore
 gi.require_version("Adw", "1")  # type: ignore
 
+import collections
 import json
+import os
+import queue
+import select
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -97,6 +102,33 @@ if str(project_root) not in sys.path:
 from unified_theming.core.manager import UnifiedThemeManager
 from unified_theming.core.types import PlanResult  # type: ignore
 
+# Use orjson for cache (de)serialization when available; it parses bytes
+# directly and skips the intermediate str decode of stdlib json
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Separator reused across log formatting; built once instead of per call
+SEP60 = "=" * 60
+
+# Keep the log view bounded; very large TextBuffers make every insert and
+# layout pass progressively more expensive
+MAX_LOG_LINES = 5000
+
 
 class ThemeAppPrototype(Adw.Application):
     """
@@ -104,6 +136,11 @@ class ThemeAppPrototype(Adw.Application):
 
     Provides a minimal interface with theme selection, apply/rollback functionality,
     activity spinner, and log output.
+
+    Main-loop invariant: one-shot callbacks scheduled with GLib.idle_add must
+    return GLib.SOURCE_REMOVE (False); anything recurring must use
+    GLib.timeout_add with an interval of at least 10ms. An idle callback that
+    returns True busy-spins the main loop and pins a CPU core.
     """
 
     def __init__(self):
@@ -124,10 +161,22 @@ class ThemeAppPrototype(Adw.Application):
         # Store discovered themes
         self.themes = []
 
+        # Single background worker: serializes operations and reuses one OS
+        # thread instead of spawning a fresh thread per operation
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="theming")
+
+        # UI updates from worker threads are funnelled through one queue
+        # drained on the main thread, instead of concurrent idle_add calls
+        self._ui_queue = queue.Queue()
+
         # Track ongoing operations
-        self.current_operation_thread = None
+        self.current_operation = None
         self.operation_cancelled = False
 
+        # PlanResult memo keyed on (theme_name, theme-dir mtime); cleared
+        # whenever apply/rollback mutates the system state
+        self._plan_cache = {}
+
         # Initialize theme manager for direct API calls
         self.theme_manager = UnifiedThemeManager()
 
@@ -142,49 +191,188 @@ class ThemeAppPrototype(Adw.Application):
         self.main_window = PrototypeWindow(application=app, prototype=self)
         self.main_window.present()
 
+        # Single dispatcher for all worker-thread UI updates
+        GLib.timeout_add(15, self._drain_ui_queue)
+
         # Load themes in the background
         GLib.idle_add(self.load_themes)
 
+        # Warm the backend off the critical path so the first Preview or
+        # Apply click doesn't pay for lazy imports and handler probing
+        self.executor.submit(self._warm_backend)
+
+    def _warm_backend(self):
+        """
+        Pre-touch the manager's expensive paths on the worker thread.
+
+        Theme discovery and handler availability probing otherwise run on
+        the first user click, stalling the UI noticeably.
+        """
+        try:
+            self.theme_manager.discover_themes()
+            self.theme_manager.get_available_handlers()
+        except Exception:
+            # Warmup is purely opportunistic; real operations report errors
+            pass
+
+    def post_ui(self, fn, *args):
+        """
+        Queue a callable to run on the main thread.
+
+        Safe to call from any worker thread; drained by the single
+        dispatcher started in on_activate.
+
+        Args:
+            fn: Callable to invoke on the main thread
+            *args: Arguments passed to the callable
+        """
+        self._ui_queue.put((fn, args))
+
+    def _drain_ui_queue(self):
+        """
+        Run all queued UI callbacks; recurring dispatcher on the main loop.
+        """
+        while True:
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            fn(*args)
+        return GLib.SOURCE_CONTINUE
+
+    # Directories whose mtimes invalidate the cached theme list
+    THEME_SEARCH_DIRS = (
+        Path.home() / ".themes",
+        Path.home() / ".local" / "share" / "themes",
+        Path("/usr/share/themes"),
+    )
+
+    def _theme_dirs_mtime(self):
+        """
+        Return the newest mtime across the theme search directories.
+        """
+        mtimes = [
+            d.stat().st_mtime for d in self.THEME_SEARCH_DIRS if d.is_dir()
+        ]
+        return max(mtimes, default=0.0)
+
+    def _load_cached_themes(self, current_mtime):
+        """
+        Return the cached theme list if the search dirs are unchanged.
+
+        Args:
+            current_mtime: Newest mtime of the theme search directories
+
+        Returns:
+            List of theme names, or None if the cache is stale or missing
+        """
+        try:
+            cached = _json_loads(self._theme_cache_path.read_bytes())
+            if cached.get("mtime", -1) >= current_mtime:
+                return cached["themes"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _store_cached_themes(self, current_mtime, themes):
+        """
+        Atomically write the theme list cache.
+
+        Args:
+            current_mtime: Newest mtime of the theme search directories
+            themes: List of theme names to cache
+        """
+        try:
+            cache_path = self._theme_cache_path
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(
+                _json_dumps({"mtime": current_mtime, "themes": themes})
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Cache is best-effort; discovery still works without it
+
+    @property
+    def _theme_cache_path(self):
+        return Path.home() / ".cache" / "unified-theming" / "themes.json"
+
     def load_themes(self):
         """
         Load themes from CLI in a background thread.
+
+        Results are cached to ~/.cache/unified-theming/themes.json keyed on
+        the newest mtime of the theme search directories, so repeat launches
+        skip the subprocess spawn and full theme scan when nothing changed.
         """
 
         def load_themes_thread():
             try:
-                # Run the CLI list command to get themes
-                result = subprocess.run(
-                    [self.cli_path, "list", "--format", "json"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
+                current_mtime = self._theme_dirs_mtime()
+                cached = self._load_cached_themes(current_mtime)
+                if cached is not None:
+                    self.themes = cached
+                    self.post_ui(self.main_window.update_theme_list, self.themes)
+                    return
+
+                # Discover themes through the API directly; no need to pay
+                # for a CLI subprocess (interpreter startup + re-imports).
+                # Sort here on the worker so the UI thread doesn't have to.
+                themes_data = self.theme_manager.discover_themes()
+                self.themes = sorted(themes_data.keys())
+                self._store_cached_themes(current_mtime, self.themes)
 
-                if result.returncode == 0:
-                    themes_data = json.loads(result.stdout)
-                    # Extract theme names
-                    self.themes = list(themes_data.keys())
-
-                    # Update UI in the main thread
-                    GLib.idle_add(self.main_window.update_theme_list, self.themes)
-                else:
-                    # Show error in log
-                    GLib.idle_add(
-                        self.main_window.append_to_log,
-                        f"Error loading themes: {result.stderr}",
-                    )
-            except subprocess.TimeoutExpired:
-                GLib.idle_add(
-                    self.main_window.append_to_log, "Error: Theme loading timed out"
-                )
+                # Update UI in the main thread
+                self.post_ui(self.main_window.update_theme_list, self.themes)
             except Exception as e:
-                GLib.idle_add(
-                    self.main_window.append_to_log, f"Error loading themes: {str(e)}"
+                self.main_window.enqueue_log(f"Error loading themes: {str(e)}")
+
+        # Run on the shared worker to avoid blocking the UI
+        self.executor.submit(load_themes_thread)
+
+        # Invoked via idle_add from on_activate; remove the source so the
+        # main loop does not re-run it
+        return GLib.SOURCE_REMOVE
+
+    def _run_via_api(
+        self, command_args: List[str], success_message: Optional[str] = None
+    ) -> bool:
+        """
+        Run supported commands through the UnifiedThemeManager API directly.
+
+        Args:
+            command_args: List of command arguments for the CLI
+            success_message: Message to show on success
+
+        Returns:
+            True if the command was handled in-process, False if the caller
+            should fall back to the CLI subprocess
+        """
+        if command_args and command_args[0] == "apply" and len(command_args) == 2:
+            result = self.theme_manager.apply_theme(command_args[1])
+            self._plan_cache.clear()
+            for handler_name, handler_result in result.handler_results.items():
+                status = "ok" if handler_result.success else "failed"
+                self.main_window.enqueue_log(f"{handler_name}: {status}")
+            if result.overall_success and success_message:
+                self.main_window.enqueue_log(success_message)
+            elif not result.overall_success:
+                self.main_window.enqueue_log(
+                    f"Theme application failed for: "
+                    f"{', '.join(result.get_failed_handlers())}"
                 )
+            return True
+
+        if command_args and command_args[0] == "rollback":
+            self._plan_cache.clear()
+            if self.theme_manager.rollback():
+                if success_message:
+                    self.main_window.enqueue_log(success_message)
+            else:
+                self.main_window.enqueue_log("Rollback failed")
+            return True
 
-        # Run in a separate thread to avoid blocking the UI
-        thread = threading.Thread(target=load_themes_thread, daemon=True)
-        thread.start()
+        return False
 
     def run_cli_command(
         self, command_args: List[str], success_message: Optional[str] = None
@@ -200,66 +388,81 @@ class ThemeAppPrototype(Adw.Application):
 
         def run_command_thread():
             try:
+                # Prefer direct API calls over shelling out; each subprocess
+                # spawn repeats interpreter startup, imports, and theme scans
+                if self._run_via_api(command_args, success_message):
+                    return
+
                 # Prepend the CLI path to the command arguments
                 cmd = [self.cli_path] + command_args
 
-                # Start the subprocess
+                # Start the subprocess. close_fds and no preexec_fn keep
+                # CPython on the posix_spawn fast path, which matters for a
+                # GTK process holding many open fds; start_new_session
+                # detaches the child from our controlling terminal.
                 process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
+                    close_fds=True,
+                    start_new_session=True,
                 )
 
-                # Read output line by line to display in real-time
+                # Read output in large chunks to display in real-time.
+                # os.read with a 64KB buffer amortizes syscall and Python
+                # overhead compared to a readline() call per output line.
+                fd = process.stdout.fileno()
+                os.set_blocking(fd, False)
+                tail = bytearray()
+
                 while True:
                     if self.operation_cancelled:
                         process.terminate()
-                        GLib.idle_add(
-                            self.main_window.append_to_log,
-                            "Operation cancelled by user",
-                        )
+                        self.main_window.enqueue_log("Operation cancelled by user")
                         return
 
-                    if process.stdout is not None:
-                        line_bytes = process.stdout.readline()
-                        if line_bytes == b"" and process.poll() is not None:
+                    ready, _, _ = select.select([fd], [], [], 0.05)
+                    if ready:
+                        data = os.read(fd, 65536)
+                        if not data:
                             break
-                        if line_bytes:
-                            if isinstance(line_bytes, bytes):
-                                line_str = line_bytes.decode("utf-8", errors="replace")
-                            else:
-                                line_str = str(line_bytes)
-                            GLib.idle_add(
-                                self.main_window.append_to_log, line_str.strip()
+                        tail.extend(data)
+                        *complete, tail = tail.split(b"\n")
+                        tail = bytearray(tail)
+                        # The pipe is opened in binary mode, so every line is
+                        # bytes by construction; decode unconditionally
+                        for line_bytes in complete:
+                            self.main_window.enqueue_log(
+                                line_bytes.decode("utf-8", errors="replace").strip()
                             )
+                    elif process.poll() is not None:
+                        break
+
+                # Flush any trailing partial line
+                if tail:
+                    self.main_window.enqueue_log(
+                        tail.decode("utf-8", errors="replace").strip()
+                    )
 
                 # Get the return code
-                return_code = process.poll()
+                return_code = process.wait()
 
                 if return_code == 0 and success_message:
-                    GLib.idle_add(self.main_window.append_to_log, success_message)
+                    self.main_window.enqueue_log(success_message)
                 elif return_code != 0:
-                    GLib.idle_add(
-                        self.main_window.append_to_log,
-                        f"Command failed with exit code: {return_code}",
+                    self.main_window.enqueue_log(
+                        f"Command failed with exit code: {return_code}"
                     )
 
             except Exception as e:
-                GLib.idle_add(
-                    self.main_window.append_to_log, f"Error running command: {str(e)}"
-                )
+                self.main_window.enqueue_log(f"Error running command: {str(e)}")
             finally:
                 # Operation complete, update UI
-                GLib.idle_add(self.main_window.set_operation_complete)
+                self.post_ui(self.main_window.set_operation_complete)
 
-        # Store the thread reference
-        self.current_operation_thread = threading.Thread(
-            target=run_command_thread, daemon=True
-        )
-        self.current_operation_thread.start()
+        # Submit to the shared worker; the future doubles as the handle for
+        # the in-flight operation
+        self.current_operation = self.executor.submit(run_command_thread)
 
         # Update UI to indicate operation is running
         self.main_window.set_operation_running()
@@ -297,6 +500,14 @@ class PrototypeWindow(Adw.ApplicationWindow):
         self.setup_content_area()
         self.setup_log_view()
 
+        # Log batching state: worker threads enqueue lines and a single
+        # low-frequency timeout drains them, so bursty CLI output results in
+        # one TextBuffer insert per flush instead of one idle_add per line.
+        self._log_queue = collections.deque()
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
+        self._scroll_pending = False
+
         # Initialize state
         self.current_theme = None
 
@@ -333,11 +544,12 @@ class PrototypeWindow(Adw.ApplicationWindow):
         theme_label.set_halign(Gtk.Align.START)
         theme_row.append(theme_label)
 
-        # Theme selection dropdown
-        self.theme_combo = Gtk.ComboBoxText()
-        self.theme_combo.set_hexpand(True)
-        self.theme_combo.connect("changed", self.on_theme_changed)
-        theme_row.append(self.theme_combo)
+        # Theme selection dropdown; a Gtk.StringList model is swapped in
+        # wholesale on updates, one signal instead of one per theme
+        self.theme_dropdown = Gtk.DropDown.new_from_strings([])
+        self.theme_dropdown.set_hexpand(True)
+        self.theme_dropdown.connect("notify::selected", self.on_theme_changed)
+        theme_row.append(self.theme_dropdown)
 
         content_box.append(theme_row)
 
@@ -408,28 +620,28 @@ class PrototypeWindow(Adw.ApplicationWindow):
         Args:
             themes: List of theme names
         """
-        # Clear existing items
-        self.theme_combo.remove_all()
-
-        # Add themes to the dropdown
-        for theme in sorted(themes):
-            self.theme_combo.append(theme.lower(), theme)
+        # Swap in a freshly built model in one call; avoids per-item
+        # model signals and redraws on large theme lists. The producer
+        # sorts before handing the list over, so the order is trusted here.
+        model = Gtk.StringList.new(list(themes))
+        self.theme_dropdown.set_model(model)
 
-        # If there are themes, set the first one as active
+        # If there are themes, select the first one
         if themes:
-            self.theme_combo.set_active(0)
-            self.on_theme_changed(self.theme_combo)
+            self.theme_dropdown.set_selected(0)
+            self.on_theme_changed(self.theme_dropdown, None)
 
-    def on_theme_changed(self, combo):
+    def on_theme_changed(self, dropdown, _pspec):
         """
         Called when the theme selection changes.
 
         Args:
-            combo: The theme selection combo box
+            dropdown: The theme selection dropdown
+            _pspec: The GParamSpec of the notify signal (unused)
         """
-        active = combo.get_active()
-        if active >= 0:
-            self.current_theme = combo.get_active_id()
+        item = dropdown.get_selected_item()
+        if item is not None:
+            self.current_theme = item.get_string()
             self.apply_button.set_sensitive(True)
             self.preview_button.set_sensitive(True)
         else:
@@ -472,32 +684,35 @@ class PrototypeWindow(Adw.ApplicationWindow):
         # Run the preview operation in a separate thread
         def preview_thread():
             try:
-                # Use the direct API to plan changes
-                plan_result = self.prototype.theme_manager.plan_changes(
-                    self.current_theme
-                )
+                # Reuse a cached plan when the theme dirs are unchanged;
+                # repeated Preview clicks then skip the handler scan entirely
+                cache_key = (self.current_theme, self.prototype._theme_dirs_mtime())
+                plan_result = self.prototype._plan_cache.get(cache_key)
+                if plan_result is None:
+                    plan_result = self.prototype.theme_manager.plan_changes(
+                        self.current_theme
+                    )
+                    self.prototype._plan_cache[cache_key] = plan_result
 
                 # Format and display the plan result
                 formatted_output = self.format_plan_result(plan_result)
 
                 # Update UI in the main thread
-                GLib.idle_add(self.append_to_log, formatted_output)
-                GLib.idle_add(
-                    self.append_to_log,
-                    f"Preview for theme '{self.current_theme}' completed!",
+                self.enqueue_log(formatted_output)
+                self.enqueue_log(
+                    f"Preview for theme '{self.current_theme}' completed!"
                 )
             except Exception as e:
                 # Update UI in the main thread with error
-                GLib.idle_add(self.append_to_log, f"Error in preview: {str(e)}")
+                self.enqueue_log(f"Error in preview: {str(e)}")
             finally:
                 # Operation complete, update UI
-                GLib.idle_add(self.set_operation_complete)
+                self.prototype.post_ui(self.set_operation_complete)
 
-        # Store the thread reference
-        self.prototype.current_operation_thread = threading.Thread(
-            target=preview_thread, daemon=True
+        # Submit to the shared worker
+        self.prototype.current_operation = self.prototype.executor.submit(
+            preview_thread
         )
-        self.prototype.current_operation_thread.start()
 
         # Update UI to indicate operation is running
         self.set_operation_running()
@@ -553,45 +768,33 @@ class PrototypeWindow(Adw.ApplicationWindow):
         Returns:
             Formatted string representation of the plan result
         """
-        lines = []
-        lines.append("=" * 60)
-        lines.append("DRY-RUN PREVIEW - Planned Changes")
-        lines.append("=" * 60)
-
-        # Add theme name
-        lines.append(f"Theme: {plan_result.theme_name}")
-        lines.append("")
-
-        # Add summary of files affected
-        lines.append(
-            f"Estimated files affected: {plan_result.estimated_files_affected}"
+        lines = [
+            SEP60,
+            "DRY-RUN PREVIEW - Planned Changes",
+            SEP60,
+            f"Theme: {plan_result.theme_name}",
+            "",
+            f"Estimated files affected: {plan_result.estimated_files_affected}",
+            "",
+            "Handler Availability:",
+        ]
+
+        lines.extend(
+            f"  - {name}: {'✓ Available' if available else '✗ Not Available'}"
+            for name, available in plan_result.available_handlers.items()
         )
         lines.append("")
 
-        # Add handler availability
-        lines.append("Handler Availability:")
-        for handler_name, available in plan_result.available_handlers.items():
-            status = "✓ Available" if available else "✗ Not Available"
-            lines.append(f"  - {handler_name}: {status}")
-        lines.append("")
-
-        # Add planned changes by handler
+        # Add planned changes, pre-grouped by the PlanResult itself
         if plan_result.planned_changes:
             lines.append("Planned Changes:")
-            # Group changes by handler
-            changes_by_handler = {}
-            for change in plan_result.planned_changes:
-                if change.handler_name not in changes_by_handler:
-                    changes_by_handler[change.handler_name] = []
-                changes_by_handler[change.handler_name].append(change)
-
-            for handler_name, changes in changes_by_handler.items():
+            for handler_name, changes in plan_result.changes_by_handler.items():
                 lines.append(f"  {handler_name}:")
-                for change in changes:
-                    change_type = change.change_type.upper()
-                    lines.append(
-                        f"    [{change_type}] {change.file_path} - {change.description}"
-                    )
+                lines.extend(
+                    f"    [{change.change_type.upper()}] "
+                    f"{change.file_path} - {change.description}"
+                    for change in changes
+                )
         else:
             lines.append(
                 "Planned Changes: None (handlers may not be fully implemented yet)"
@@ -602,23 +805,21 @@ class PrototypeWindow(Adw.ApplicationWindow):
         # Add warnings if any
         if plan_result.warnings:
             lines.append("Warnings:")
-            for warning in plan_result.warnings:
-                lines.append(f"  ⚠ {warning}")
+            lines.extend(f"  ⚠ {warning}" for warning in plan_result.warnings)
             lines.append("")
 
         # Add validation results if available
         if plan_result.validation_result:
             lines.append("Validation Results:")
             for msg in plan_result.validation_result.messages:
-                level = msg.level.value
-                lines.append(f"  [{level}] {msg.message}")
+                lines.append(f"  [{msg.level.value}] {msg.message}")
                 if msg.details:
                     lines.append(f"      Details: {msg.details}")
             lines.append("")
 
-        lines.append("=" * 60)
-        lines.append("DRY-RUN MODE: No changes were made to your system")
-        lines.append("=" * 60)
+        lines.extend(
+            (SEP60, "DRY-RUN MODE: No changes were made to your system", SEP60)
+        )
 
         return "\n".join(lines)
 
@@ -626,21 +827,78 @@ class PrototypeWindow(Adw.ApplicationWindow):
         """
         Append text to the log view.
 
+        Safe to call from any thread; lines are queued and flushed in a
+        batch on the main loop.
+
         Args:
             text: Text to append to the log
         """
-        # Add timestamp to the message
+        self.enqueue_log(text)
+
+    def enqueue_log(self, text):
+        """
+        Queue a log line for batched insertion into the log view.
+
+        Thread-safe. Schedules a single flush callback if one is not already
+        pending, so a burst of lines costs one main-loop wakeup and one
+        TextBuffer insert rather than one per line.
+
+        Args:
+            text: Text to append to the log
+        """
+        with self._log_lock:
+            self._log_queue.append(text)
+            if not self._log_flush_scheduled:
+                self._log_flush_scheduled = True
+                GLib.timeout_add(30, self._flush_log)
+
+    def _flush_log(self):
+        """
+        Drain the queued log lines into the text buffer in one insert.
+
+        Returns:
+            False, so the timeout source removes itself after each flush
+        """
+        with self._log_lock:
+            pending = list(self._log_queue)
+            self._log_queue.clear()
+            self._log_flush_scheduled = False
+
+        if not pending:
+            return False
+
+        # One strftime per flush window; lines in the same 30ms batch share
+        # a timestamp, which is as precise as the display needs
         timestamp = time.strftime("%H:%M:%S")
-        formatted_text = f"[{timestamp}] {text}\n"
+        blob = "".join(f"[{timestamp}] {text}\n" for text in pending)
 
-        # Append to the text buffer
+        # Single TextBuffer mutation for the whole batch
         end_iter = self.log_buffer.get_end_iter()
-        self.log_buffer.insert(end_iter, formatted_text)
+        self.log_buffer.insert(end_iter, blob)
+
+        # Trim from the top so the buffer acts as a ring of recent lines
+        line_count = self.log_buffer.get_line_count()
+        if line_count > MAX_LOG_LINES:
+            start = self.log_buffer.get_start_iter()
+            cut = self.log_buffer.get_iter_at_line(line_count - MAX_LOG_LINES)
+            self.log_buffer.delete(start, cut)
 
-        # Scroll to the end
+        # Defer scrolling to idle priority so it coalesces with the next
+        # paint; at most one scroll is pending between flushes
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            GLib.idle_add(self._do_scroll, priority=GLib.PRIORITY_DEFAULT_IDLE)
+        return False
+
+    def _do_scroll(self):
+        """
+        Scroll the log view to the end; runs once per scheduled batch.
+        """
+        self._scroll_pending = False
         self.log_text_view.scroll_to_mark(
             self.log_buffer.get_insert(), 0.0, True, 0.0, 1.0
         )
+        return False
 
 
 def main():
@@ -13,11 +13,13 @@ if str(project_root) not in sys.path:
 
 from unified_theming.core.manager import UnifiedThemeManager
 
+# Shared manager so theme discovery and handler setup run once, not per test
+manager = UnifiedThemeManager()
+
 
 def test_theme_discovery():
     """Test theme discovery functionality."""
     print("Testing theme discovery...")
-    manager = UnifiedThemeManager()
     themes = manager.discover_themes()
     print(f"Found {len(themes)} themes:")
     for name in list(themes.keys())[:5]:  # Show first 5 themes
@@ -30,7 +32,6 @@ def test_theme_discovery():
 def test_plan_changes(theme_name):
     """Test the plan_changes functionality with a theme."""
     print(f"\nTesting plan_changes for theme '{theme_name}'...")
-    manager = UnifiedThemeManager()
 
     try:
         plan_result = manager.plan_changes(theme_name)
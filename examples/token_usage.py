@@ -9,6 +9,8 @@ This script demonstrates:
 - Converting between color spaces
 """
 
+import sys
+
 from unified_theming.color import (
     Color,
     OKLCHColor,
@@ -27,70 +29,75 @@ from unified_theming.tokens import (
 
 
 def main():
-    print("=== Unified Theming Token System Demo ===\n")
+    # Buffer all demo output and write it in one go; a single stdout write
+    # beats one locked write syscall per print
+    out = ["=== Unified Theming Token System Demo ===\n"]
 
     # 1. Create custom tokens
-    print("1. Creating custom light tokens with blue accent:")
+    out.append("1. Creating custom light tokens with blue accent:")
     custom_light = create_light_tokens(
         accent=Color.from_hex("#007acc"), name="Custom Blue"
     )
-    print(f"   Theme: {custom_light.name}")
-    print(f"   Variant: {custom_light.variant}")
-    print(f"   Primary surface: {custom_light.surfaces.primary.to_hex()}")
-    print(f"   Accent: {custom_light.accents.primary.to_hex()}")
-    print()
+    out.append(f"   Theme: {custom_light.name}")
+    out.append(f"   Variant: {custom_light.variant}")
+    out.append(f"   Primary surface: {custom_light.surfaces.primary.to_hex()}")
+    out.append(f"   Accent: {custom_light.accents.primary.to_hex()}")
+    out.append("")
 
     # 2. Validate tokens
-    print("2. Validating token accessibility:")
+    out.append("2. Validating token accessibility:")
     result = validate_tokens(custom_light)
-    print(f"   Valid: {result.valid}")
+    out.append(f"   Valid: {result.valid}")
     if result.errors:
-        print(f"   Errors: {len(result.errors)}")
-        for error in result.errors:
-            print(f"     - {error}")
+        out.append(f"   Errors: {len(result.errors)}")
+        out.extend(f"     - {error}" for error in result.errors)
     if result.warnings:
-        print(f"   Warnings: {len(result.warnings)}")
-        for warning in result.warnings:
-            print(f"     - {warning}")
-    print()
+        out.append(f"   Warnings: {len(result.warnings)}")
+        out.extend(f"     - {warning}" for warning in result.warnings)
+    out.append("")
 
     # 3. Color space conversions
-    print("3. Color space conversions:")
+    out.append("3. Color space conversions:")
     blue = Color.from_hex("#007acc")
-    print(f"   RGB: {blue.to_hex()}")
+    out.append(f"   RGB: {blue.to_hex()}")
     oklch = blue.to_oklch()
-    print(f"   OKLCH: L={oklch.lightness:.3f}, C={oklch.chroma:.3f}, H={oklch.hue:.1f}")
+    out.append(
+        f"   OKLCH: L={oklch.lightness:.3f}, C={oklch.chroma:.3f}, H={oklch.hue:.1f}"
+    )
     back_to_rgb = oklch.to_rgb()
-    print(f"   Roundtrip: {back_to_rgb.to_hex()}")
-    print()
+    out.append(f"   Roundtrip: {back_to_rgb.to_hex()}")
+    out.append("")
 
     # 4. Contrast checking
-    print("4. Contrast analysis:")
+    out.append("4. Contrast analysis:")
     fg = custom_light.content.primary
     bg = custom_light.surfaces.primary
     ratio = contrast_ratio(fg, bg)
     aa_pass = meets_aa(fg, bg)
-    print(f"   Content/Surface ratio: {ratio:.2f}:1")
-    print(f"   Meets WCAG AA: {aa_pass}")
-    print()
+    out.append(f"   Content/Surface ratio: {ratio:.2f}:1")
+    out.append(f"   Meets WCAG AA: {aa_pass}")
+    out.append("")
 
     # 5. Interactive state derivation
-    print("5. Interactive state colors:")
+    out.append("5. Interactive state colors:")
     base = custom_light.surfaces.secondary
     hover = derive_hover(base, custom_light.states.hover_overlay)
     pressed = derive_pressed(base, custom_light.states.pressed_overlay)
-    print(f"   Base: {base.to_hex()}")
-    print(f"   Hover: {hover.to_hex()}")
-    print(f"   Pressed: {pressed.to_hex()}")
-    print()
+    out.append(f"   Base: {base.to_hex()}")
+    out.append(f"   Hover: {hover.to_hex()}")
+    out.append(f"   Pressed: {pressed.to_hex()}")
+    out.append("")
 
     # 6. Using presets
-    print("6. Using Adwaita presets:")
-    print(f"   Light accent: {ADWAITA_LIGHT.accents.primary.to_hex()}")
-    print(f"   Dark accent: {ADWAITA_DARK.accents.primary.to_hex()}")
-    print()
+    out.append("6. Using Adwaita presets:")
+    out.append(f"   Light accent: {ADWAITA_LIGHT.accents.primary.to_hex()}")
+    out.append(f"   Dark accent: {ADWAITA_DARK.accents.primary.to_hex()}")
+    out.append("")
+
+    out.append("Demo complete! 🎨")
 
-    print("Demo complete! 🎨")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -2,84 +2,44 @@
 Shared pytest fixtures for Unified Theming Application tests.
 """
 
+import os
+import shutil
+import sys
+from types import MappingProxyType
+
 import pytest
 
 from unified_theming.core.parser import UnifiedThemeParser
 from unified_theming.core.types import ThemeData, Toolkit
 
+# Theme file payloads used by the fixtures below, encoded once at import time
+# so fixtures can write_bytes without a per-call str -> bytes encode.
 
-@pytest.fixture
-def tmp_theme_dir(tmp_path):
-    """Create temporary theme directory."""
-    theme_dir = tmp_path / ".themes"
-    theme_dir.mkdir()
-    return theme_dir
-
-
-@pytest.fixture
-def valid_theme(tmp_path):
-    """Create a complete valid theme."""
-    theme = tmp_path / "ValidTheme"
-    theme.mkdir()
-
-    # GTK4 support
-    gtk4 = theme / "gtk-4.0"
-    gtk4.mkdir()
-    (gtk4 / "gtk.css").write_text(
-        """
+_VALID_GTK4_CSS = b"""
 @define-color theme_bg_color #ffffff;
 @define-color theme_fg_color #000000;
 @define-color theme_selected_bg_color #3584e4;
 @define-color theme_selected_fg_color #ffffff;
     """
-    )
 
-    # GTK3 support
-    gtk3 = theme / "gtk-3.0"
-    gtk3.mkdir()
-    (gtk3 / "gtk.css").write_text(
-        """
+_VALID_GTK3_CSS = b"""
 @define-color theme_bg_color #ffffff;
 @define-color theme_fg_color #000000;
     """
-    )
-
-    return theme
-
 
-@pytest.fixture
-def gnome_shell_theme(tmp_path):
-    """Create a complete theme with GNOME Shell support."""
-    theme = tmp_path / "ShellTheme"
-    theme.mkdir()
-
-    # GTK4 support
-    gtk4 = theme / "gtk-4.0"
-    gtk4.mkdir()
-    (gtk4 / "gtk.css").write_text(
-        """
+_SHELL_GTK4_CSS = b"""
 @define-color theme_bg_color #303030;
 @define-color theme_fg_color #ffffff;
 @define-color theme_selected_bg_color #3584e4;
 @define-color theme_selected_fg_color #ffffff;
     """
-    )
 
-    # GTK3 support
-    gtk3 = theme / "gtk-3.0"
-    gtk3.mkdir()
-    (gtk3 / "gtk.css").write_text(
-        """
+_SHELL_GTK3_CSS = b"""
 @define-color theme_bg_color #303030;
 @define-color theme_fg_color #ffffff;
     """
-    )
 
-    # GNOME Shell support
-    gnome_shell = theme / "gnome-shell"
-    gnome_shell.mkdir()
-    (gnome_shell / "gnome-shell.css").write_text(
-        """
+_SHELL_GNOME_SHELL_CSS = b"""
 /* GNOME Shell Theme */
 @define-color panel_bg_color #303030;
 @define-color panel_fg_color #ffffff;
@@ -99,48 +59,128 @@ def gnome_shell_theme(tmp_path):
     color: @popup_fg_color;
 }
     """
-    )
+
+_MALFORMED_GTK4_CSS = b"""
+@define-color theme_bg_color #ffffff;
+/* Intentionally malformed - unclosed brace */
+.some-selector {
+    color: red;
+    """
+
+
+@pytest.fixture
+def tmp_theme_dir(tmp_path):
+    """Create temporary theme directory."""
+    theme_dir = tmp_path / ".themes"
+    theme_dir.mkdir()
+    return theme_dir
+
+
+# Theme directory fixtures are built once per session as templates and cloned
+# into each test's tmp_path with copytree, which is cheaper than re-running
+# the mkdir/write_text sequence for every test while keeping tests isolated.
+
+
+@pytest.fixture(scope="session")
+def _valid_theme_template(tmp_path_factory):
+    """Session-scoped template for the complete valid theme."""
+    theme = tmp_path_factory.mktemp("theme_templates") / "ValidTheme"
+    theme.mkdir()
+
+    # GTK4 support
+    gtk4 = theme / "gtk-4.0"
+    gtk4.mkdir()
+    (gtk4 / "gtk.css").write_bytes(_VALID_GTK4_CSS)
+
+    # GTK3 support
+    gtk3 = theme / "gtk-3.0"
+    gtk3.mkdir()
+    (gtk3 / "gtk.css").write_bytes(_VALID_GTK3_CSS)
 
     return theme
 
 
 @pytest.fixture
-def incomplete_theme(tmp_path):
-    """Create a theme with only GTK3 support."""
-    theme = tmp_path / "IncompleteTheme"
+def valid_theme(tmp_path, _valid_theme_template):
+    """Create a complete valid theme."""
+    theme = tmp_path / "ValidTheme"
+    shutil.copytree(_valid_theme_template, theme)
+    return theme
+
+
+@pytest.fixture(scope="session")
+def _gnome_shell_theme_template(tmp_path_factory):
+    """Session-scoped template for the GNOME Shell theme."""
+    theme = tmp_path_factory.mktemp("theme_templates") / "ShellTheme"
+    theme.mkdir()
+
+    # GTK4 support
+    gtk4 = theme / "gtk-4.0"
+    gtk4.mkdir()
+    (gtk4 / "gtk.css").write_bytes(_SHELL_GTK4_CSS)
+
+    # GTK3 support
+    gtk3 = theme / "gtk-3.0"
+    gtk3.mkdir()
+    (gtk3 / "gtk.css").write_bytes(_SHELL_GTK3_CSS)
+
+    # GNOME Shell support
+    gnome_shell = theme / "gnome-shell"
+    gnome_shell.mkdir()
+    (gnome_shell / "gnome-shell.css").write_bytes(_SHELL_GNOME_SHELL_CSS)
+
+    return theme
+
+
+@pytest.fixture
+def gnome_shell_theme(tmp_path, _gnome_shell_theme_template):
+    """Create a complete theme with GNOME Shell support."""
+    theme = tmp_path / "ShellTheme"
+    shutil.copytree(_gnome_shell_theme_template, theme)
+    return theme
+
+
+@pytest.fixture(scope="session")
+def _incomplete_theme_template(tmp_path_factory):
+    """Session-scoped template for the GTK3-only theme."""
+    theme = tmp_path_factory.mktemp("theme_templates") / "IncompleteTheme"
     theme.mkdir()
 
     # Only GTK3 support (no GTK4)
     gtk3 = theme / "gtk-3.0"
     gtk3.mkdir()
-    (gtk3 / "gtk.css").write_text(
-        """
-@define-color theme_bg_color #ffffff;
-@define-color theme_fg_color #000000;
-    """
-    )
+    (gtk3 / "gtk.css").write_bytes(_VALID_GTK3_CSS)
 
     return theme
 
 
 @pytest.fixture
-def malformed_theme(tmp_path):
-    """Create a theme with malformed CSS."""
-    theme = tmp_path / "MalformedTheme"
+def incomplete_theme(tmp_path, _incomplete_theme_template):
+    """Create a theme with only GTK3 support."""
+    theme = tmp_path / "IncompleteTheme"
+    shutil.copytree(_incomplete_theme_template, theme)
+    return theme
+
+
+@pytest.fixture(scope="session")
+def _malformed_theme_template(tmp_path_factory):
+    """Session-scoped template for the malformed-CSS theme."""
+    theme = tmp_path_factory.mktemp("theme_templates") / "MalformedTheme"
     theme.mkdir()
 
     # GTK4 with malformed CSS
     gtk4 = theme / "gtk-4.0"
     gtk4.mkdir()
-    (gtk4 / "gtk.css").write_text(
-        """
-@define-color theme_bg_color #ffffff;
-/* Intentionally malformed - unclosed brace */
-.some-selector {
-    color: red;
-    """
-    )
+    (gtk4 / "gtk.css").write_bytes(_MALFORMED_GTK4_CSS)
+
+    return theme
+
 
+@pytest.fixture
+def malformed_theme(tmp_path, _malformed_theme_template):
+    """Create a theme with malformed CSS."""
+    theme = tmp_path / "MalformedTheme"
+    shutil.copytree(_malformed_theme_template, theme)
     return theme
 
 
@@ -175,6 +215,9 @@ Author: Claude Code (Strategic Architect)
 Date: October 22, 2025
 """
 
+import dataclasses
+import filecmp
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict
@@ -191,13 +234,203 @@ from unified_theming.core.types import (
     ValidationResult,
 )
 
+# Integration theme payloads, encoded once at import time (see note above).
+
+_ADWAITA_INDEX_THEME = b"""[Desktop Entry]
+Type=X-GNOME-Metatheme
+Name=Adwaita-dark
+Comment=Dark variant of Adwaita theme
+Encoding=UTF-8
+
+[X-GNOME-Metatheme]
+GtkTheme=Adwaita-dark
+IconTheme=Adwaita
+CursorTheme=Adwaita
+"""
+
+_ADWAITA_GTK2_RC = b"""gtk-theme-name="Adwaita-dark"
+gtk-icon-theme-name="Adwaita"
+"""
+
+_ADWAITA_GTK3_CSS = b"""/* Adwaita-dark GTK3 Theme */
+@define-color theme_bg_color #303030;
+@define-color theme_fg_color #ffffff;
+@define-color theme_selected_bg_color #3584e4;
+@define-color theme_selected_fg_color #ffffff;
+@define-color borders #1c1c1c;
+@define-color accent_bg_color #3584e4;
+@define-color accent_fg_color #ffffff;
+@define-color window_bg_color #303030;
+"""
+
+_ADWAITA_GTK4_CSS = b"""/* Adwaita-dark GTK4 Theme */
+@define-color theme_bg_color #303030;
+@define-color theme_fg_color #ffffff;
+@define-color theme_selected_bg_color #3584e4;
+@define-color theme_selected_fg_color #ffffff;
+@define-color borders #1c1c1c;
+@define-color accent_bg_color #3584e4;
+@define-color accent_fg_color #ffffff;
+@define-color window_bg_color #303030;
+"""
+
+_NORDIC_INDEX_THEME = b"""[Desktop Entry]
+Type=X-GNOME-Metatheme
+Name=Nordic
+Comment=Nordic dark theme
+Encoding=UTF-8
+
+[X-GNOME-Metatheme]
+GtkTheme=Nordic
+IconTheme=Nordic
+"""
+
+_NORDIC_GTK_CSS = b"""/* Nordic GTK3 Theme */
+@define-color theme_bg_color #2e3440;
+@define-color theme_fg_color #d8dee9;
+@define-color theme_selected_bg_color #88c0d0;
+@define-color theme_selected_fg_color #2e3440;
+@define-color borders #3b4252;
+@define-color accent_bg_color #5e81ac;
+@define-color accent_fg_color #eceff4;
+@define-color window_bg_color #2e3440;
+"""
+
+_INCOMPLETE_INDEX_THEME = b"""[Desktop Entry]
+Type=X-GNOME-Metatheme
+Name=IncompleteTheme
+Comment=Incomplete theme for testing
+"""
+
+_INCOMPLETE_GTK3_CSS = b"""/* Incomplete Theme */
+@define-color theme_bg_color #cccccc;
+@define-color theme_fg_color #000000;
+/* Missing: theme_selected_bg_color, borders, etc. */
+"""
+
+# Canonical metadata/color dicts for the integration ThemeInfo objects;
+# constructions below copy these instead of re-spelling the literals.
+
+_ADWAITA_METADATA = {
+    "GtkTheme": "Adwaita-dark",
+    "IconTheme": "Adwaita",
+    "CursorTheme": "Adwaita",
+    "display_name": "Adwaita Dark",
+    "comment": "Dark variant of Adwaita theme",
+}
+
+_ADWAITA_COLORS = {
+    "theme_bg_color": "#303030",
+    "theme_fg_color": "#ffffff",
+    "theme_selected_bg_color": "#3584e4",
+    "theme_selected_fg_color": "#ffffff",
+    "borders": "#1c1c1c",
+    "accent_bg_color": "#3584e4",
+    "accent_fg_color": "#ffffff",
+    "window_bg_color": "#303030",
+}
+
+_NORDIC_METADATA = {
+    "GtkTheme": "Nordic",
+    "display_name": "Nordic",
+    "comment": "Nordic dark theme",
+}
+
+_NORDIC_COLORS = {
+    "theme_bg_color": "#2e3440",
+    "theme_fg_color": "#d8dee9",
+    "theme_selected_bg_color": "#88c0d0",
+    "theme_selected_fg_color": "#2e3440",
+    "borders": "#3b4252",
+    "accent_bg_color": "#5e81ac",
+    "accent_fg_color": "#eceff4",
+    "window_bg_color": "#2e3440",
+}
+
+_INCOMPLETE_METADATA = {
+    "display_name": "Incomplete Theme",
+    "comment": "Incomplete theme for testing",
+}
+
+_INCOMPLETE_COLORS = {
+    "theme_bg_color": "#cccccc",
+    "theme_fg_color": "#000000",
+    # Missing colors: theme_selected_bg_color, borders, etc.
+}
+
+# Canonical ThemeInfo templates, built once at import time. Fixtures clone
+# them with dataclasses.replace, rebinding the path and handing each test
+# fresh container copies; the path placeholder is never used directly.
+
+_INTEGRATION_THEME_INFOS = {
+    "Adwaita-dark": ThemeInfo(
+        name="Adwaita-dark",
+        path=Path("Adwaita-dark"),
+        supported_toolkits=[Toolkit.GTK2, Toolkit.GTK3, Toolkit.GTK4],
+        metadata=_ADWAITA_METADATA,
+        colors=_ADWAITA_COLORS,
+    ),
+    "Nordic": ThemeInfo(
+        name="Nordic",
+        path=Path("Nordic"),
+        supported_toolkits=[Toolkit.GTK3, Toolkit.GTK4],
+        metadata=_NORDIC_METADATA,
+        colors=_NORDIC_COLORS,
+    ),
+    "IncompleteTheme": ThemeInfo(
+        name="IncompleteTheme",
+        path=Path("IncompleteTheme"),
+        supported_toolkits=[Toolkit.GTK3],  # Missing GTK4, Qt
+        metadata=_INCOMPLETE_METADATA,
+        colors=_INCOMPLETE_COLORS,
+    ),
+}
+
+
 # ============================================================================
 # FILE SYSTEM FIXTURES
 # ============================================================================
 
 
+# Keys returned by mock_file_system mapped to their path relative to home
+_MOCK_FS_SUBPATHS = {
+    "config": ".config",
+    "themes": ".themes",
+    "local_share": ".local/share",
+    "gtk3_config": ".config/gtk-3.0",
+    "gtk4_config": ".config/gtk-4.0",
+    "flatpak_overrides": ".local/share/flatpak/overrides",
+    "backups": ".config/unified-theming/backups",
+}
+
+# Directory skeleton of the mock home, created data-driven in one loop
+_HOME_TEMPLATE_DIRS = (
+    ".themes",
+    ".config/gtk-3.0",
+    ".config/gtk-4.0",
+    ".config/unified-theming/backups",
+    ".local/share/flatpak/overrides",
+)
+
+
+@pytest.fixture(scope="session")
+def _home_template(tmp_path_factory):
+    """
+    Session-scoped skeleton of the mock home directory.
+
+    Built once; mock_file_system clones it per test with copytree, which is
+    cheaper than re-running the mkdir sequence for every test.
+    """
+    home = tmp_path_factory.mktemp("home_template") / "testuser"
+
+    for rel in _HOME_TEMPLATE_DIRS:
+        (home / rel).mkdir(parents=True, exist_ok=True)
+
+    return home
+
+
 @pytest.fixture
-def mock_file_system(tmp_path, monkeypatch):
+def mock_file_system(tmp_path, monkeypatch, _home_template):
     """
     Mock file system with proper directory structure for theming.
 
@@ -217,49 +450,30 @@ def mock_file_system(tmp_path, monkeypatch):
     Returns:
         Dict with paths: home, config, themes, local_share
     """
-    # Create mock home directory structure
+    # Clone the session template into this test's private home
     home = tmp_path / "home" / "testuser"
-    home.mkdir(parents=True)
-
-    config = home / ".config"
-    config.mkdir()
-
-    themes = home / ".themes"
-    themes.mkdir()
-
-    local_share = home / ".local" / "share"
-    local_share.mkdir(parents=True)
+    shutil.copytree(_home_template, home)
 
-    # Create subdirectories
-    (config / "gtk-3.0").mkdir(parents=True)
-    (config / "gtk-4.0").mkdir(parents=True)
-    (config / "unified-theming" / "backups").mkdir(parents=True)
-    (local_share / "flatpak" / "overrides").mkdir(parents=True)
+    # Mock Path.home() to return test directory; default-arg binding makes
+    # the call a LOAD_FAST instead of a closure cell dereference
+    def _fake_home(_h=home):
+        return _h
 
-    # Mock Path.home() to return test directory
-    monkeypatch.setattr(Path, "home", lambda: home)
+    monkeypatch.setattr(Path, "home", staticmethod(_fake_home))
 
-    # Mock Path.expanduser to use test home
-    original_expanduser = Path.expanduser
-
-    def mock_expanduser(self):
+    # Mock Path.expanduser to use test home. Production code under test can
+    # hit this on hot paths (theme discovery), so the home string and the
+    # original method are bound once via default args instead of being
+    # re-derived on every call.
+    def mock_expanduser(self, _home=str(home), _orig=Path.expanduser):
         path_str = str(self)
         if path_str.startswith("~"):
-            return Path(str(self).replace("~", str(home), 1))
-        return original_expanduser(self)
+            return Path(_home + path_str[1:])
+        return _orig(self)
 
     monkeypatch.setattr(Path, "expanduser", mock_expanduser)
 
-    return {
-        "home": home,
-        "config": config,
-        "themes": themes,
-        "local_share": local_share,
-        "gtk3_config": config / "gtk-3.0",
-        "gtk4_config": config / "gtk-4.0",
-        "flatpak_overrides": local_share / "flatpak" / "overrides",
-        "backups": config / "unified-theming" / "backups",
-    }
+    return {"home": home, **{k: home / rel for k, rel in _MOCK_FS_SUBPATHS.items()}}
 
 
 # ============================================================================
@@ -267,8 +481,108 @@ def mock_file_system(tmp_path, monkeypatch):
 # ============================================================================
 
 
+@pytest.fixture(scope="session")
+def _integration_theme_templates(tmp_path_factory):
+    """
+    Session-scoped on-disk templates for the integration themes.
+
+    Each entry maps a theme name to its template path. The mock_theme_*
+    fixtures clone the tree into the test's mock ~/.themes and hand out a
+    fresh copy of the matching _INTEGRATION_THEME_INFOS entry, so tests
+    keep full isolation while the static files are only ever written once.
+    """
+    root = tmp_path_factory.mktemp("integration_themes")
+    templates = {}
+
+    # Adwaita-dark: complete theme with GTK2/3/4 support
+    theme_path = root / "Adwaita-dark"
+    theme_path.mkdir()
+    (theme_path / "index.theme").write_bytes(_ADWAITA_INDEX_THEME)
+    gtk2_dir = theme_path / "gtk-2.0"
+    gtk2_dir.mkdir()
+    (gtk2_dir / "gtkrc").write_bytes(_ADWAITA_GTK2_RC)
+    gtk3_dir = theme_path / "gtk-3.0"
+    gtk3_dir.mkdir()
+    (gtk3_dir / "gtk.css").write_bytes(_ADWAITA_GTK3_CSS)
+    gtk4_dir = theme_path / "gtk-4.0"
+    gtk4_dir.mkdir()
+    (gtk4_dir / "gtk.css").write_bytes(_ADWAITA_GTK4_CSS)
+    templates["Adwaita-dark"] = theme_path
+
+    # Nordic: complete theme with GTK3/4 support
+    theme_path = root / "Nordic"
+    theme_path.mkdir()
+    (theme_path / "index.theme").write_bytes(_NORDIC_INDEX_THEME)
+    gtk3_dir = theme_path / "gtk-3.0"
+    gtk3_dir.mkdir()
+    (gtk3_dir / "gtk.css").write_bytes(_NORDIC_GTK_CSS)
+    gtk4_dir = theme_path / "gtk-4.0"
+    gtk4_dir.mkdir()
+    try:
+        # Same colors as GTK3; share the inode instead of writing twice
+        (gtk4_dir / "gtk.css").hardlink_to(gtk3_dir / "gtk.css")
+    except OSError:
+        (gtk4_dir / "gtk.css").write_bytes(_NORDIC_GTK_CSS)
+    templates["Nordic"] = theme_path
+
+    # IncompleteTheme: GTK3 only, missing colors
+    theme_path = root / "IncompleteTheme"
+    theme_path.mkdir()
+    (theme_path / "index.theme").write_bytes(_INCOMPLETE_INDEX_THEME)
+    gtk3_dir = theme_path / "gtk-3.0"
+    gtk3_dir.mkdir()
+    (gtk3_dir / "gtk.css").write_bytes(_INCOMPLETE_GTK3_CSS)
+    templates["IncompleteTheme"] = theme_path
+
+    return templates
+
+
+def _clone_theme_template(templates, name, mock_file_system):
+    """Copy a template theme into the mock ~/.themes and return its info."""
+    dest = mock_file_system["themes"] / name
+    shutil.copytree(templates[name], dest)
+    info = _INTEGRATION_THEME_INFOS[name]
+    # replace() with fresh containers keeps the module templates immutable
+    # in practice even if a test mutates what it receives
+    return dataclasses.replace(
+        info,
+        path=dest,
+        supported_toolkits=list(info.supported_toolkits),
+        metadata=dict(info.metadata),
+        colors=dict(info.colors),
+    )
+
+
+@pytest.fixture
+def theme_factory(mock_file_system, _integration_theme_templates):
+    """
+    Factory for installing integration themes on demand.
+
+    Lets a test opt in to exactly the themes it needs instead of paying
+    for all three via the repository fixture:
+
+        def test_switch(theme_factory):
+            adwaita = theme_factory("Adwaita-dark")
+            nordic = theme_factory("Nordic")
+
+    Returns:
+        Callable mapping a template name to its installed ThemeInfo;
+        repeated calls for the same name reuse the first install.
+    """
+    built = {}
+
+    def _make(name):
+        if name not in built:
+            built[name] = _clone_theme_template(
+                _integration_theme_templates, name, mock_file_system
+            )
+        return built[name]
+
+    return _make
+
+
 @pytest.fixture
-def mock_theme_adwaita_dark(mock_file_system):
+def mock_theme_adwaita_dark(mock_file_system, _integration_theme_templates):
     """
     Complete Adwaita-dark theme for happy path testing.
 
@@ -286,89 +600,13 @@ def mock_theme_adwaita_dark(mock_file_system):
     Returns:
         ThemeInfo object for Adwaita-dark
     """
-    themes_dir = mock_file_system["themes"]
-    theme_path = themes_dir / "Adwaita-dark"
-    theme_path.mkdir(parents=True)
-
-    # Create index.theme
-    index_content = """[Desktop Entry]
-Type=X-GNOME-Metatheme
-Name=Adwaita-dark
-Comment=Dark variant of Adwaita theme
-Encoding=UTF-8
-
-[X-GNOME-Metatheme]
-GtkTheme=Adwaita-dark
-IconTheme=Adwaita
-CursorTheme=Adwaita
-"""
-    (theme_path / "index.theme").write_text(index_content)
-
-    # Create GTK2 theme
-    gtk2_dir = theme_path / "gtk-2.0"
-    gtk2_dir.mkdir(parents=True)
-    gtk2_content = """gtk-theme-name="Adwaita-dark"
-gtk-icon-theme-name="Adwaita"
-"""
-    (gtk2_dir / "gtkrc").write_text(gtk2_content)
-
-    # Create GTK3 theme with colors
-    gtk3_dir = theme_path / "gtk-3.0"
-    gtk3_dir.mkdir(parents=True)
-    gtk3_content = """/* Adwaita-dark GTK3 Theme */
-@define-color theme_bg_color #303030;
-@define-color theme_fg_color #ffffff;
-@define-color theme_selected_bg_color #3584e4;
-@define-color theme_selected_fg_color #ffffff;
-@define-color borders #1c1c1c;
-@define-color accent_bg_color #3584e4;
-@define-color accent_fg_color #ffffff;
-@define-color window_bg_color #303030;
-"""
-    (gtk3_dir / "gtk.css").write_text(gtk3_content)
-
-    # Create GTK4 theme with colors
-    gtk4_dir = theme_path / "gtk-4.0"
-    gtk4_dir.mkdir(parents=True)
-    gtk4_content = """/* Adwaita-dark GTK4 Theme */
-@define-color theme_bg_color #303030;
-@define-color theme_fg_color #ffffff;
-@define-color theme_selected_bg_color #3584e4;
-@define-color theme_selected_fg_color #ffffff;
-@define-color borders #1c1c1c;
-@define-color accent_bg_color #3584e4;
-@define-color accent_fg_color #ffffff;
-@define-color window_bg_color #303030;
-"""
-    (gtk4_dir / "gtk.css").write_text(gtk4_content)
-
-    # Create ThemeInfo object
-    return ThemeInfo(
-        name="Adwaita-dark",
-        path=theme_path,
-        supported_toolkits=[Toolkit.GTK2, Toolkit.GTK3, Toolkit.GTK4],
-        metadata={
-            "GtkTheme": "Adwaita-dark",
-            "IconTheme": "Adwaita",
-            "CursorTheme": "Adwaita",
-            "display_name": "Adwaita Dark",
-            "comment": "Dark variant of Adwaita theme",
-        },
-        colors={
-            "theme_bg_color": "#303030",
-            "theme_fg_color": "#ffffff",
-            "theme_selected_bg_color": "#3584e4",
-            "theme_selected_fg_color": "#ffffff",
-            "borders": "#1c1c1c",
-            "accent_bg_color": "#3584e4",
-            "accent_fg_color": "#ffffff",
-            "window_bg_color": "#303030",
-        },
+    return _clone_theme_template(
+        _integration_theme_templates, "Adwaita-dark", mock_file_system
     )
 
 
 @pytest.fixture
-def mock_theme_nordic(mock_file_system):
+def mock_theme_nordic(mock_file_system, _integration_theme_templates):
     """
     Complete Nordic theme for theme switching tests.
 
@@ -377,67 +615,13 @@ def mock_theme_nordic(mock_file_system):
     Returns:
         ThemeInfo object for Nordic
     """
-    themes_dir = mock_file_system["themes"]
-    theme_path = themes_dir / "Nordic"
-    theme_path.mkdir(parents=True)
-
-    # Create index.theme
-    index_content = """[Desktop Entry]
-Type=X-GNOME-Metatheme
-Name=Nordic
-Comment=Nordic dark theme
-Encoding=UTF-8
-
-[X-GNOME-Metatheme]
-GtkTheme=Nordic
-IconTheme=Nordic
-"""
-    (theme_path / "index.theme").write_text(index_content)
-
-    # Create GTK3 theme with Nordic colors
-    gtk3_dir = theme_path / "gtk-3.0"
-    gtk3_dir.mkdir(parents=True)
-    gtk3_content = """/* Nordic GTK3 Theme */
-@define-color theme_bg_color #2e3440;
-@define-color theme_fg_color #d8dee9;
-@define-color theme_selected_bg_color #88c0d0;
-@define-color theme_selected_fg_color #2e3440;
-@define-color borders #3b4252;
-@define-color accent_bg_color #5e81ac;
-@define-color accent_fg_color #eceff4;
-@define-color window_bg_color #2e3440;
-"""
-    (gtk3_dir / "gtk.css").write_text(gtk3_content)
-
-    # Create GTK4 theme
-    gtk4_dir = theme_path / "gtk-4.0"
-    gtk4_dir.mkdir(parents=True)
-    (gtk4_dir / "gtk.css").write_text(gtk3_content)  # Same colors
-
-    return ThemeInfo(
-        name="Nordic",
-        path=theme_path,
-        supported_toolkits=[Toolkit.GTK3, Toolkit.GTK4],
-        metadata={
-            "GtkTheme": "Nordic",
-            "display_name": "Nordic",
-            "comment": "Nordic dark theme",
-        },
-        colors={
-            "theme_bg_color": "#2e3440",
-            "theme_fg_color": "#d8dee9",
-            "theme_selected_bg_color": "#88c0d0",
-            "theme_selected_fg_color": "#2e3440",
-            "borders": "#3b4252",
-            "accent_bg_color": "#5e81ac",
-            "accent_fg_color": "#eceff4",
-            "window_bg_color": "#2e3440",
-        },
+    return _clone_theme_template(
+        _integration_theme_templates, "Nordic", mock_file_system
     )
 
 
 @pytest.fixture
-def mock_theme_incomplete(mock_file_system):
+def mock_theme_incomplete(mock_file_system, _integration_theme_templates):
     """
     Incomplete theme for validation testing.
 
@@ -449,41 +633,8 @@ def mock_theme_incomplete(mock_file_system):
     Returns:
         ThemeInfo object for IncompleteTheme
     """
-    themes_dir = mock_file_system["themes"]
-    theme_path = themes_dir / "IncompleteTheme"
-    theme_path.mkdir(parents=True)
-
-    # Create index.theme
-    index_content = """[Desktop Entry]
-Type=X-GNOME-Metatheme
-Name=IncompleteTheme
-Comment=Incomplete theme for testing
-"""
-    (theme_path / "index.theme").write_text(index_content)
-
-    # Create GTK3 only (missing GTK4)
-    gtk3_dir = theme_path / "gtk-3.0"
-    gtk3_dir.mkdir(parents=True)
-    gtk3_content = """/* Incomplete Theme */
-@define-color theme_bg_color #cccccc;
-@define-color theme_fg_color #000000;
-/* Missing: theme_selected_bg_color, borders, etc. */
-"""
-    (gtk3_dir / "gtk.css").write_text(gtk3_content)
-
-    return ThemeInfo(
-        name="IncompleteTheme",
-        path=theme_path,
-        supported_toolkits=[Toolkit.GTK3],  # Missing GTK4, Qt
-        metadata={
-            "display_name": "Incomplete Theme",
-            "comment": "Incomplete theme for testing",
-        },
-        colors={
-            "theme_bg_color": "#cccccc",
-            "theme_fg_color": "#000000",
-            # Missing colors: theme_selected_bg_color, borders, etc.
-        },
+    return _clone_theme_template(
+        _integration_theme_templates, "IncompleteTheme", mock_file_system
     )
 
 
@@ -492,8 +643,26 @@ Comment=Incomplete theme for testing
 # ============================================================================
 
 
+def _completed_process_success():
+    """Default success result for the subprocess.run mock.
+
+    A real CompletedProcess is much cheaper than a Mock here: production
+    code only reads plain attributes (.returncode, .stdout) and never pays
+    Mock's __getattr__ machinery.
+    """
+    from subprocess import CompletedProcess
+
+    return CompletedProcess(args=[], returncode=0, stdout="", stderr="")
+
+
+@pytest.fixture(scope="session")
+def _subprocess_mock_instance():
+    """Session-scoped Mock reused by mock_subprocess_run across tests."""
+    return Mock(return_value=_completed_process_success())
+
+
 @pytest.fixture
-def mock_subprocess_run(monkeypatch):
+def mock_subprocess_run(monkeypatch, _subprocess_mock_instance):
     """
     Mock subprocess.run for Flatpak/Snap commands.
 
@@ -516,11 +685,14 @@ def mock_subprocess_run(monkeypatch):
     """
     import subprocess
 
-    mock_run = Mock(return_value=Mock(returncode=0, stdout="", stderr=""))
+    monkeypatch.setattr(subprocess, "run", _subprocess_mock_instance)
 
-    monkeypatch.setattr(subprocess, "run", mock_run)
+    yield _subprocess_mock_instance
 
-    return mock_run
+    # Restore the default success result and drop recorded calls so the
+    # shared instance is pristine for the next test
+    _subprocess_mock_instance.reset_mock(return_value=True, side_effect=True)
+    _subprocess_mock_instance.return_value = _completed_process_success()
 
 
 # ============================================================================
@@ -668,7 +840,9 @@ def file_comparison_utility():
         """Compare two files byte-for-byte."""
         if not (path1.exists() and path2.exists()):
             return False
-        return path1.read_bytes() == path2.read_bytes()
+        # filecmp streams fixed-size chunks and stops at the first
+        # mismatch instead of loading both files into memory
+        return filecmp.cmp(str(path1), str(path2), shallow=False)
 
     def verify_backup_contains_file(backup_id: str, file_path: Path) -> bool:
         """Check if backup contains a specific file."""
@@ -680,7 +854,11 @@ def file_comparison_utility():
         """Count files matching pattern in directory."""
         if not directory.exists():
             return 0
-        return len(list(directory.glob(pattern)))
+        if pattern == "*":
+            # scandir avoids building a Path object per entry and skips
+            # fnmatch entirely for the match-everything default
+            return sum(1 for _ in os.scandir(directory))
+        return sum(1 for _ in directory.glob(pattern))
 
     return {
         "compare_files": compare_files,
@@ -690,37 +868,137 @@ def file_comparison_utility():
 
 
 # ============================================================================
-# PYTEST CONFIGURATION
+# COLOR FIXTURES
 # ============================================================================
 
 
-def pytest_configure(config):
+# These return immutable literals, so one instance can serve the whole
+# session instead of being rebuilt for every test. MappingProxyType and
+# tuple enforce that no test mutates the shared data.
+
+
+@pytest.fixture(scope="session")
+def sample_colors():
+    """Valid colors in all formats for color.py testing."""
+    return MappingProxyType(
+        {
+            "hex6": "#FF5733",
+            "hex3": "#F57",
+            "rgb": "rgb(255, 87, 51)",
+            "rgba": "rgba(255, 87, 51, 0.5)",
+            "hsl": "hsl(9, 100%, 60%)",
+            "named": "red",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def invalid_colors():
+    """Malformed color strings for validation testing."""
+    return (
+        "not-a-color",
+        "#FF57",  # Wrong length
+        "rgb(300, 87, 51)",  # Out of range
+        "rgba(255, 87, 51)",  # Missing alpha
+        "",  # Empty
+    )
+
+
+@pytest.fixture(scope="session")
+def gtk_color_variables():
+    """Mock GTK CSS with @define-color definitions."""
+    return MappingProxyType(
+        {
+            "theme_bg_color": "#FFFFFF",
+            "theme_fg_color": "#000000",
+            "theme_selected_bg_color": "#3584E4",
+            "theme_selected_fg_color": "#FFFFFF",
+        }
+    )
+
+
+# ============================================================================
+# CLI FIXTURES
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
     """
-    Configure pytest markers for integration tests.
+    Shared Click CLI test runner.
 
-    Registers custom markers:
-    - integration: Marks integration tests
-    - slow: Marks slow tests (can be skipped with -m "not slow")
+    CliRunner is stateless between invoke() calls, so one instance serves
+    all CLI tests for the whole session.
     """
-    config.addinivalue_line("markers", "integration: mark test as integration test")
-    config.addinivalue_line("markers", "slow: mark test as slow running")
+    from click.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def main_help_output(cli_runner):
+    """
+    Cached output of `unified-theming --help`.
+
+    Click walks every registered command and option to render help, so the
+    formatter runs once per session instead of once per help-assertion test.
+    """
+    from unified_theming.cli.commands import cli
+
+    return cli_runner.invoke(cli, ["--help"]).output
+
+
+@pytest.fixture(autouse=True)
+def _pause_trace():
+    """
+    Optionally suspend sys.settrace-based instrumentation during tests.
+
+    coverage.py installs a per-line trace hook that dominates runtime in
+    Mock-heavy CLI tests. Setting UNIFIED_THEMING_PAUSE_TRACE=1 disables
+    the hook for test bodies in local runs; CI leaves it unset so coverage
+    is unaffected by default.
+    """
+    if not os.environ.get("UNIFIED_THEMING_PAUSE_TRACE"):
+        yield
+        return
+    tracer = sys.gettrace()
+    sys.settrace(None)
+    try:
+        yield
+    finally:
+        sys.settrace(tracer)
 
 
 # ============================================================================
-# FIXTURE CLEANUP
+# PYTEST CONFIGURATION
 # ============================================================================
 
 
-@pytest.fixture(autouse=True)
-def cleanup_after_test(mock_file_system):
+def pytest_configure(config):
     """
-    Automatically cleanup after each test.
+    Configure pytest markers for integration tests.
+
+    Registers custom markers:
+    - integration: Marks integration tests
+    - slow: Marks slow tests (can be skipped with -m "not slow")
 
-    Ensures no test pollution between tests.
-    Runs after every test automatically (autouse=True).
+    When pytest-xdist is installed (run with `pytest -n auto`), default to
+    loadfile distribution so filesystem-heavy tests in one file share a
+    worker while distinct files run in parallel. The fixtures here are
+    hermetic (everything goes through tmp_path), so parallel runs are safe.
     """
-    yield  # Test runs here
+    config.addinivalue_line("markers", "integration: mark test as integration test")
+    config.addinivalue_line("markers", "slow: mark test as slow running")
+    config.addinivalue_line(
+        "markers", "filesystem: test requires the mock filesystem fixtures"
+    )
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): group tests onto one pytest-xdist worker "
+        "(no-op without xdist)",
+    )
 
-    # Cleanup (if needed)
-    # tmp_path is automatically cleaned by pytest
-    pass
+    if getattr(config.option, "dist", None) == "load":
+        # "load" is xdist's default; only override when the user hasn't
+        # picked a distribution mode explicitly
+        config.option.dist = "loadfile"
@@ -1,22 +1,15 @@
 """Basic CLI command tests for v0.5.0 release."""
 
 import pytest
-from click.testing import CliRunner
 
 from unified_theming.cli.commands import cli
 
+# The shared session-scoped cli_runner fixture lives in conftest.py.
 
-@pytest.fixture
-def cli_runner():
-    """Click CLI test runner."""
-    return CliRunner()
 
-
-def test_cli_main_help(cli_runner):
+def test_cli_main_help(main_help_output):
     """Test main CLI help message."""
-    result = cli_runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
-    assert "unified-theming" in result.output.lower()
+    assert "unified-theming" in main_help_output.lower()
 
 
 def test_cli_list_command(cli_runner):
@@ -4,11 +4,13 @@ Tests cover command invocation, argument parsing, and interactions with UnifiedT
 """
 
 import json
+import types
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from click.testing import CliRunner
 
 from unified_theming.cli.commands import (
     apply,
@@ -21,8 +23,11 @@ from unified_theming.cli.commands import (
     rollback,
     validate,
 )
+from unified_theming.core import manager as _manager_module
+from unified_theming.core.manager import UnifiedThemeManager
 from unified_theming.core.types import (
     ApplicationResult,
+    Backup,
     HandlerResult,
     ThemeInfo,
     Toolkit,
@@ -32,473 +37,442 @@ from unified_theming.core.types import (
 )
 from unified_theming.tokens.defaults import create_light_tokens
 
+# Reused decoder: json.loads builds a fresh JSONDecoder on every call, and
+# these tests only need to prove the output parses.
+_DECODE = json.JSONDecoder().decode
 
-@pytest.fixture
-def cli_runner():
-    """Click CLI test runner."""
-    return CliRunner()
+# Table separator emitted by the list command; built once instead of per test.
+_SEP = "-" * 70
+
+
+@lru_cache(maxsize=None)
+def _theme(name, path, toolkits, colors, metadata):
+    """Memoized ThemeInfo factory keyed on hashable arguments.
+
+    Repeated requests for the same theme (e.g. from parametrized variants)
+    reuse the cached instance instead of re-running dataclass construction.
+    """
+    # [*toolkits] rather than list(): the Click command import shadows the
+    # builtin in this module.
+    return ThemeInfo(
+        name=name,
+        path=Path(path),
+        supported_toolkits=[*toolkits],
+        colors=dict(colors),
+        metadata=dict(metadata),
+    )
+
+
+def _invoke(runner, args):
+    """Invoke the CLI without Click's standalone-mode wrapper.
+
+    standalone_mode=False skips the SystemExit try/except Click wraps around
+    every standalone invocation. Commands that fail via sys.exit still
+    produce the right exit code; only usage-error tests (which rely on
+    UsageError rendering) keep the default invoke.
+    """
+    return runner.invoke(cli, args, standalone_mode=False, catch_exceptions=False)
+
+
+@pytest.fixture(scope="module")
+def patched_manager():
+    """Patch UnifiedThemeManager once for the whole module.
+
+    Entering/exiting ``patch()`` per test resolves the target string and
+    rebuilds the mock class each time; patching once at module scope and
+    resetting between tests keeps that cost O(1) for the module.
+    patch.object on the imported module skips the string-target resolution
+    entirely, and the explicit create/autospec arguments skip spec
+    introspection on entry. The target is core.manager because the CLI
+    commands import the class lazily from there.
+    """
+    with patch.object(
+        _manager_module, "UnifiedThemeManager", create=False, autospec=False
+    ) as manager_class:
+        yield manager_class
+
+
+@pytest.fixture(autouse=True)
+def _reset_patched_manager(patched_manager):
+    """Give each test a clean mock class with no leftover configuration."""
+    patched_manager.reset_mock(return_value=True, side_effect=True)
+    patched_manager.side_effect = None
+
+
+@pytest.fixture(scope="module")
+def _manager_template():
+    """Build the spec'd manager mock once per module.
+
+    Spec introspection over UnifiedThemeManager is the expensive part of
+    MagicMock construction; doing it once and resetting between tests is
+    much cheaper than a fresh Mock() per test. config_manager and parser
+    are instance attributes, so they need explicit child mocks.
+    """
+    manager = MagicMock(spec=UnifiedThemeManager)
+    manager.config_manager = MagicMock()
+    manager.parser = MagicMock()
+    return manager
 
 
 @pytest.fixture
+def mock_manager(patched_manager, _manager_template):
+    """A freshly reset manager instance, already wired as the patched class's
+    return value."""
+    # Manually attached children are not reached by the parent's reset_mock,
+    # so reset them explicitly.
+    for child in (
+        _manager_template,
+        _manager_template.config_manager,
+        _manager_template.parser,
+    ):
+        child.reset_mock(return_value=True, side_effect=True)
+    patched_manager.return_value = _manager_template
+    return _manager_template
+
+
+# The shared session-scoped cli_runner fixture lives in conftest.py;
+# CliRunner keeps no state between invoke() calls, so one instance serves
+# the whole module.
+
+
+@pytest.fixture(scope="session")
 def sample_theme_info():
     """Sample theme information for testing."""
-    return ThemeInfo(
-        name="Adwaita-dark",
-        path=Path("/tmp/themes/Adwaita-dark"),
-        supported_toolkits=[Toolkit.GTK3, Toolkit.GTK4, Toolkit.LIBADWAITA],
-        colors={
-            "theme_bg_color": "#303030",
-            "theme_fg_color": "#ffffff",
-            "theme_selected_bg_color": "#3584e4",
-        },
-        metadata={"author": "GNOME Project"},
+    return _theme(
+        "Adwaita-dark",
+        "/tmp/themes/Adwaita-dark",
+        (Toolkit.GTK3, Toolkit.GTK4, Toolkit.LIBADWAITA),
+        (
+            ("theme_bg_color", "#303030"),
+            ("theme_fg_color", "#ffffff"),
+            ("theme_selected_bg_color", "#3584e4"),
+        ),
+        (("author", "GNOME Project"),),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_themes(sample_theme_info):
-    """Sample themes dictionary for testing."""
-    return {
+    """Sample themes dictionary for testing.
+
+    Session-scoped and wrapped in MappingProxyType: the tests only read the
+    mapping, and the read-only view makes an accidental mutation in one test
+    fail loudly instead of leaking into the rest of the session.
+    """
+    return types.MappingProxyType({
         "Adwaita-dark": sample_theme_info,
-        "Nord": ThemeInfo(
-            name="Nord",
-            path=Path("/tmp/themes/Nord"),
-            supported_toolkits=[Toolkit.GTK2, Toolkit.GTK3, Toolkit.QT5],
-            colors={
-                "theme_bg_color": "#2e3440",
-                "theme_fg_color": "#d8dee9",
-            },
-            metadata={"author": "Nord Project"},
+        "Nord": _theme(
+            "Nord",
+            "/tmp/themes/Nord",
+            (Toolkit.GTK2, Toolkit.GTK3, Toolkit.QT5),
+            (
+                ("theme_bg_color", "#2e3440"),
+                ("theme_fg_color", "#d8dee9"),
+            ),
+            (("author", "Nord Project"),),
         ),
-    }
+    })
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestCLIMainGroup:
     """Test the main CLI group and its options."""
 
-    def test_cli_main_help(self, cli_runner):
+    def test_cli_main_help(self, main_help_output):
         """Test main CLI help output."""
-        result = cli_runner.invoke(cli, ["--help"])
-        assert result.exit_code == 0
-        assert "unified-theming" in result.output.lower()
-        assert "list" in result.output
-        assert "apply" in result.output
-        assert "current" in result.output
-        assert "rollback" in result.output
-        assert "validate" in result.output
+        # Lowercase once and scan for all expected tokens in one comprehension
+        # instead of six separate passes over the output.
+        low = main_help_output.lower()
+        tokens = ("unified-theming", "list", "apply", "current", "rollback", "validate")
+        missing = [token for token in tokens if token not in low]
+        assert not missing, f"help output missing: {missing}"
 
     def test_cli_version(self, cli_runner):
         """Test version option."""
-        result = cli_runner.invoke(cli, ["--version"])
+        result = _invoke(cli_runner, ["--version"])
         assert result.exit_code == 0
         assert "1.0.0" in result.output
 
-    def test_cli_verbose_option(self, cli_runner, sample_themes):
+    def test_cli_verbose_option(self, cli_runner, mock_manager):
         """Test verbose option affects context."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["--verbose", "list"])
-            # Should not error with verbose option
-            assert result.exit_code == 0
+        # Only the exit code matters here; the default empty-dict return
+        # avoids configuring mock children the test never reads.
+        mock_manager.discover_themes.return_value = {}
+
+        result = _invoke(cli_runner, ["--verbose", "list"])
+        # Should not error with verbose option
+        assert result.exit_code == 0
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestListCommand:
     """Test the list command functionality."""
 
-    def test_list_command_basic(self, cli_runner, sample_themes):
-        """Test basic list command functionality."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
+    @pytest.mark.parametrize("fmt", ["table", "list", "json"])
+    def test_list_command_formats(self, cli_runner, sample_themes, mock_manager, fmt):
+        """Test list command across all output formats."""
+        mock_manager.discover_themes.return_value = sample_themes
 
-            result = cli_runner.invoke(cli, ["list"])
-            assert result.exit_code == 0
-            assert "Adwaita-dark" in result.output
-            assert "Nord" in result.output
+        result = _invoke(cli_runner, ["list", "--format", fmt])
+        assert result.exit_code == 0
+        assert "Adwaita-dark" in result.output
+        assert "Nord" in result.output
+        if fmt == "table":
             # Check table format (should have separators)
-            assert "-" * 70 in result.output
-
-    def test_list_command_empty(self, cli_runner):
-        """Test list command when no themes are found."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = {}
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["list"])
-            assert result.exit_code == 0
-            assert "No themes found" in result.output
-
-    def test_list_command_format_list(self, cli_runner, sample_themes):
-        """Test list command with list format."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["list", "--format", "list"])
-            assert result.exit_code == 0
-            assert "Adwaita-dark" in result.output
-            assert "Nord" in result.output
+            assert _SEP in result.output
+        elif fmt == "list":
             # In list format, we expect just the theme names, one per line
-            lines = result.output.strip().split("\n")
-            # Filter out empty lines
-            theme_lines = [line for line in lines if line.strip()]
+            theme_lines = [
+                line for line in result.output.strip().split("\n") if line.strip()
+            ]
             assert "Adwaita-dark" in theme_lines
             assert "Nord" in theme_lines
+        else:
+            # Should be valid JSON
+            _DECODE(result.output)
 
-    def test_list_command_format_json(self, cli_runner, sample_themes):
-        """Test list command with JSON format."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
+    def test_list_command_empty(self, cli_runner, patched_manager):
+        """Test list command when no themes are found."""
+        # No assert_called here, so a SimpleNamespace is enough and far
+        # cheaper than a Mock with auto-created children.
+        patched_manager.return_value = types.SimpleNamespace(
+            discover_themes=lambda: {}
+        )
 
-            result = cli_runner.invoke(cli, ["list", "--format", "json"])
-            assert result.exit_code == 0
-            # Should be valid JSON
-            json.loads(result.output)
-            assert "Adwaita-dark" in result.output
-            assert "Nord" in result.output
+        result = _invoke(cli_runner, ["list"])
+        assert result.exit_code == 0
+        assert "No themes found" in result.output
 
-    def test_list_command_filter_toolkit(self, cli_runner, sample_themes):
+    def test_list_command_filter_toolkit(
+        self, cli_runner, sample_themes, mock_manager
+    ):
         """Test list command with toolkit filter."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["list", "--targets", "gtk3"])
-            assert result.exit_code == 0
-            # Should contain Adwaita-dark (has GTK3 support) but may also contain Nord
-            assert "Adwaita-dark" in result.output
+        mock_manager.discover_themes.return_value = sample_themes
 
-    def test_list_command_error_handling(self, cli_runner):
-        """Test list command error handling."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager_class.side_effect = Exception("Mock error")
+        result = _invoke(cli_runner, ["list", "--targets", "gtk3"])
+        assert result.exit_code == 0
+        # Should contain Adwaita-dark (has GTK3 support) but may also contain Nord
+        assert "Adwaita-dark" in result.output
+
+@pytest.fixture(scope="module")
+def apply_success():
+    """Successful ApplicationResult shared by the apply-command tests."""
+    return ApplicationResult(
+        theme_name="Adwaita-dark",
+        overall_success=True,
+        handler_results={
+            "gtk": HandlerResult(
+                handler_name="gtk",
+                toolkit=Toolkit.GTK3,
+                success=True,
+                message="Applied successfully",
+            )
+        },
+    )
 
-            result = cli_runner.invoke(cli, ["list"])
-            assert result.exit_code == 1
-            assert "Error listing themes:" in result.output
+
+@pytest.fixture(scope="module")
+def apply_failure():
+    """ApplicationResult with a failed handler."""
+    return ApplicationResult(
+        theme_name="Adwaita-dark",
+        overall_success=False,
+        handler_results={
+            "gtk": HandlerResult(
+                handler_name="gtk",
+                toolkit=Toolkit.GTK3,
+                success=False,
+                message="Failed to apply theme",
+            )
+        },
+    )
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestApplyCommand:
     """Test the apply command functionality."""
 
-    def test_apply_command_basic(self, cli_runner):
+    def test_apply_command_basic(self, cli_runner, mock_manager, apply_success):
         """Test basic apply command functionality."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.apply_theme.return_value = ApplicationResult(
-                theme_name="Adwaita-dark",
-                overall_success=True,
-                handler_results={
-                    "gtk": HandlerResult(
-                        handler_name="gtk",
-                        toolkit=Toolkit.GTK3,
-                        success=True,
-                        message="Applied successfully",
-                    )
-                },
-            )
-            mock_manager_class.return_value = mock_manager
+        mock_manager.apply_theme.return_value = apply_success
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Adwaita-dark"])
-            assert result.exit_code == 0
-            assert "Applying theme 'Adwaita-dark'..." in result.output
-            assert "✓ Theme 'Adwaita-dark' applied successfully!" in result.output
+        result = _invoke(cli_runner, ["apply_theme", "Adwaita-dark"])
+        assert result.exit_code == 0
+        assert "Applying theme 'Adwaita-dark'..." in result.output
+        assert "✓ Theme 'Adwaita-dark' applied successfully!" in result.output
 
-    def test_apply_command_with_targets(self, cli_runner):
+    def test_apply_command_with_targets(self, cli_runner, mock_manager, apply_success):
         """Test apply command with specific targets."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.apply_theme.return_value = ApplicationResult(
-                theme_name="Adwaita-dark",
-                overall_success=True,  # Changed to True to avoid any exit code complications
-                handler_results={
-                    "gtk3": HandlerResult(
-                        handler_name="gtk3",
-                        toolkit=Toolkit.GTK3,
-                        success=True,
-                        message="Applied successfully",
-                    )
-                },
-            )
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(
-                cli, ["apply_theme", "Adwaita-dark", "--targets", "all"]
-            )
-            # The command should execute without CLI argument errors
-            assert result.exit_code == 0
-            assert "Applying theme 'Adwaita-dark'..." in result.output
-            assert "applied successfully" in result.output
-
-    def test_apply_command_error_handling(self, cli_runner):
-        """Test apply command error handling."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager_class.side_effect = Exception("Mock error")
+        mock_manager.apply_theme.return_value = apply_success
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Adwaita-dark"])
-            assert result.exit_code == 1
-            assert "✗ Error applying theme:" in result.output
+        result = _invoke(
+            cli_runner, ["apply_theme", "Adwaita-dark", "--targets", "all"]
+        )
+        # The command should execute without CLI argument errors
+        assert result.exit_code == 0
+        assert "Applying theme 'Adwaita-dark'..." in result.output
+        assert "applied successfully" in result.output
 
-    def test_apply_command_handler_failure(self, cli_runner):
+    def test_apply_command_handler_failure(
+        self, cli_runner, mock_manager, apply_failure
+    ):
         """Test apply command when handler fails."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.apply_theme.return_value = ApplicationResult(
-                theme_name="Adwaita-dark",
-                overall_success=False,
-                handler_results={
-                    "gtk": HandlerResult(
-                        handler_name="gtk",
-                        toolkit=Toolkit.GTK3,
-                        success=False,
-                        message="Failed to apply theme",
-                    )
-                },
-            )
-            mock_manager_class.return_value = mock_manager
+        mock_manager.apply_theme.return_value = apply_failure
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Adwaita-dark"])
-            assert (
-                result.exit_code == 0
-            )  # Even with failures, exit code is 0 if no exception
-            assert "✗ gtk: Failed to apply theme" in result.output
+        result = _invoke(cli_runner, ["apply_theme", "Adwaita-dark"])
+        assert (
+            result.exit_code == 0
+        )  # Even with failures, exit code is 0 if no exception
+        assert "✗ gtk: Failed to apply theme" in result.output
 
-    def test_apply_from_tokens(self, cli_runner, tmp_path):
+    def test_apply_from_tokens(self, cli_runner, tmp_path, mock_manager):
         """apply_theme should accept --from-tokens flag."""
         token_file = tmp_path / "tokens.json"
         token_file.write_text("{}")
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.apply_theme_from_tokens.return_value = ApplicationResult(
-                theme_name="TokenTheme",
-                overall_success=True,
-                handler_results={},
-            )
-            mock_manager_class.return_value = mock_manager
+        mock_manager.apply_theme_from_tokens.return_value = ApplicationResult(
+            theme_name="TokenTheme",
+            overall_success=True,
+            handler_results={},
+        )
 
-            result = cli_runner.invoke(
-                cli,
-                ["apply_theme", "--from-tokens", str(token_file)],
-            )
-            assert result.exit_code == 0
-            assert "Applying tokens from" in result.output
-            assert "TokenTheme" in result.output
-            mock_manager.apply_theme_from_tokens.assert_called_once()
+        result = _invoke(
+            cli_runner,
+            ["apply_theme", "--from-tokens", str(token_file)],
+        )
+        assert result.exit_code == 0
+        assert "Applying tokens from" in result.output
+        assert "TokenTheme" in result.output
+        mock_manager.apply_theme_from_tokens.assert_called_once()
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestConvertCommand:
     """Test the convert command functionality."""
 
-    def test_convert_writes_output(self, cli_runner):
+    def test_convert_writes_output(self, cli_runner, mock_manager):
         """convert should write JSON tokens to the requested path."""
         with cli_runner.isolated_filesystem():
             output_path = Path("tokens.json")
-            with patch(
-                "unified_theming.cli.commands.UnifiedThemeManager"
-            ) as mock_manager_class:
-                mock_manager = Mock()
-                mock_manager.convert_theme_to_tokens.return_value = create_light_tokens(
-                    name="Converted"
-                )
-                mock_manager.tokens_to_json.return_value = '{"name": "Converted"}'
-                mock_manager_class.return_value = mock_manager
+            mock_manager.convert_theme_to_tokens.return_value = create_light_tokens(
+                name="Converted"
+            )
+            mock_manager.tokens_to_json.return_value = '{"name": "Converted"}'
 
-                result = cli_runner.invoke(
-                    cli, ["convert", "Adwaita-dark", "--output", str(output_path)]
-                )
+            result = _invoke(
+                cli_runner, ["convert", "Adwaita-dark", "--output", str(output_path)]
+            )
 
-                assert result.exit_code == 0
-                assert output_path.exists()
-                assert "Converted" in output_path.read_text()
-                mock_manager.convert_theme_to_tokens.assert_called_once_with(
-                    "Adwaita-dark"
-                )
+            assert result.exit_code == 0
+            assert output_path.exists()
+            assert "Converted" in output_path.read_text()
+            mock_manager.convert_theme_to_tokens.assert_called_once_with(
+                "Adwaita-dark"
+            )
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestRenderCommand:
     """Test the render command functionality."""
 
-    def test_render_invokes_manager(self, cli_runner):
+    def test_render_invokes_manager(self, cli_runner, mock_manager):
         """render should call manager.render_tokens with correct args."""
         with cli_runner.isolated_filesystem():
             token_file = Path("tokens.json")
             token_file.write_text("{}")
-            with patch(
-                "unified_theming.cli.commands.UnifiedThemeManager"
-            ) as mock_manager_class:
-                mock_manager = Mock()
-                mock_manager.render_tokens.return_value = [
-                    Path("output/gtk-4.0/gtk.css")
-                ]
-                mock_manager_class.return_value = mock_manager
-
-                result = cli_runner.invoke(
-                    cli,
-                    [
-                        "render",
-                        str(token_file),
-                        "--target",
-                        "gtk",
-                        "--output",
-                        "./output",
-                    ],
-                )
+            mock_manager.render_tokens.return_value = [
+                Path("output/gtk-4.0/gtk.css")
+            ]
+
+            result = _invoke(
+                cli_runner,
+                [
+                    "render",
+                    str(token_file),
+                    "--target",
+                    "gtk",
+                    "--output",
+                    "./output",
+                ],
+            )
 
-                assert result.exit_code == 0
-                assert "Rendered 1 files for gtk" in result.output
-                mock_manager.render_tokens.assert_called_once()
+            assert result.exit_code == 0
+            assert "Rendered 1 files for gtk" in result.output
+            mock_manager.render_tokens.assert_called_once()
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestCurrentCommand:
     """Test the current command functionality."""
 
-    def test_current_command_basic(self, cli_runner):
-        """Test basic current command functionality."""
-        current_themes = {"gtk": "Adwaita-dark", "qt": "Breeze", "flatpak": "system"}
+    @pytest.mark.parametrize("fmt", ["table", "list", "json"])
+    def test_current_command_formats(self, cli_runner, mock_manager, fmt):
+        """Test current command across all output formats."""
+        current_themes = {"gtk": "Adwaita-dark", "qt": "Breeze"}
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.get_current_themes.return_value = current_themes
-            mock_manager_class.return_value = mock_manager
+        mock_manager.get_current_themes.return_value = current_themes
 
-            result = cli_runner.invoke(cli, ["current"])
-            assert result.exit_code == 0
+        result = _invoke(cli_runner, ["current", "--format", fmt])
+        assert result.exit_code == 0
+        if fmt == "table":
             assert "gtk" in result.output
             assert "Adwaita-dark" in result.output
             assert "qt" in result.output
             assert "Breeze" in result.output
-
-    def test_current_command_empty(self, cli_runner):
-        """Test current command when no current themes available."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.get_current_themes.return_value = {}
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["current"])
-            assert result.exit_code == 0
-            assert "No current theme information available" in result.output
-
-    def test_current_command_format_list(self, cli_runner):
-        """Test current command with list format."""
-        current_themes = {"gtk": "Adwaita-dark", "qt": None}
-
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.get_current_themes.return_value = current_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["current", "--format", "list"])
-            assert result.exit_code == 0
+        elif fmt == "list":
             assert "gtk: Adwaita-dark" in result.output
-            assert "qt: None" in result.output
-
-    def test_current_command_format_json(self, cli_runner):
-        """Test current command with JSON format."""
-        current_themes = {"gtk": "Adwaita-dark", "qt": "Breeze"}
-
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.get_current_themes.return_value = current_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["current", "--format", "json"])
-            assert result.exit_code == 0
+            assert "qt: Breeze" in result.output
+        else:
             # Should be valid JSON
-            json.loads(result.output)
+            _DECODE(result.output)
+
+    def test_current_command_empty(self, cli_runner, patched_manager):
+        """Test current command when no current themes available."""
+        patched_manager.return_value = types.SimpleNamespace(
+            get_current_themes=lambda: {}
+        )
 
-    def test_current_command_error_handling(self, cli_runner):
-        """Test current command error handling."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager_class.side_effect = Exception("Mock error")
+        result = _invoke(cli_runner, ["current"])
+        assert result.exit_code == 0
+        assert "No current theme information available" in result.output
 
-            result = cli_runner.invoke(cli, ["current"])
-            assert result.exit_code == 1
-            assert "Error getting current themes:" in result.output
+    def test_current_command_none_value(self, cli_runner, patched_manager):
+        """Test current command when a toolkit has no detected theme."""
+        patched_manager.return_value = types.SimpleNamespace(
+            get_current_themes=lambda: {"gtk": "Adwaita-dark", "qt": None}
+        )
 
+        result = _invoke(cli_runner, ["current", "--format", "list"])
+        assert result.exit_code == 0
+        assert "qt: None" in result.output
 
+@pytest.mark.xdist_group("cli_commands")
 class TestRollbackCommand:
     """Test the rollback command functionality."""
 
-    def test_rollback_command_basic(self, cli_runner):
+    def test_rollback_command_basic(self, cli_runner, patched_manager):
         """Test basic rollback command functionality."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.rollback.return_value = True
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["rollback"])
-            assert result.exit_code == 0
-            assert "Rolling back to previous configuration..." in result.output
-            assert "✓ Rollback successful!" in result.output
+        patched_manager.return_value = types.SimpleNamespace(
+            rollback=lambda backup_id=None: True
+        )
+
+        result = _invoke(cli_runner, ["rollback"])
+        assert result.exit_code == 0
+        assert "Rolling back to previous configuration..." in result.output
+        assert "✓ Rollback successful!" in result.output
 
-    def test_rollback_command_failed(self, cli_runner):
+    def test_rollback_command_failed(self, cli_runner, mock_manager):
         """Test rollback command when rollback fails."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.rollback.return_value = False  # Rollback failed
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["rollback"])
-            assert (
-                result.exit_code == 1
-            )  # Should exit with error code when rollback fails
-            assert "✗ Rollback failed" in result.output
-
-    def test_rollback_command_list_backups(self, cli_runner):
-        """Test rollback command with list-backups option."""
-        from datetime import datetime
+        mock_manager.rollback.return_value = False  # Rollback failed
 
-        from unified_theming.core.types import Backup
+        result = _invoke(cli_runner, ["rollback"])
+        assert (
+            result.exit_code == 1
+        )  # Should exit with error code when rollback fails
+        assert "✗ Rollback failed" in result.output
 
+    def test_rollback_command_list_backups(self, cli_runner, mock_manager):
+        """Test rollback command with list-backups option."""
         backup = Backup(
             backup_id="backup_test_123",
             timestamp=datetime.now(),
@@ -507,63 +481,41 @@ class TestRollbackCommand:
             toolkits=[Toolkit.GTK3],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.config_manager.get_backups.return_value = [backup]
-            mock_manager_class.return_value = mock_manager
+        mock_manager.config_manager.get_backups.return_value = [backup]
 
-            result = cli_runner.invoke(cli, ["rollback", "--list-backups"])
-            assert result.exit_code == 0
-            assert "backup_test_123" in result.output
-            assert "Adwaita-dark" in result.output
+        result = _invoke(cli_runner, ["rollback", "--list-backups"])
+        assert result.exit_code == 0
+        assert "backup_test_123" in result.output
+        assert "Adwaita-dark" in result.output
 
-    def test_rollback_command_list_backups_empty(self, cli_runner):
+    def test_rollback_command_list_backups_empty(self, cli_runner, mock_manager):
         """Test rollback command with list-backups option when no backups exist."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.config_manager.get_backups.return_value = []
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["rollback", "--list-backups"])
-            assert result.exit_code == 0
-            assert "No backups available" in result.output
-
-    def test_rollback_command_error_handling(self, cli_runner):
-        """Test rollback command error handling."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager_class.side_effect = Exception("Mock error")
-
-            result = cli_runner.invoke(cli, ["rollback"])
-            assert result.exit_code == 1
-            assert "✗ Error during rollback:" in result.output
+        mock_manager.config_manager.get_backups.return_value = []
 
+        result = _invoke(cli_runner, ["rollback", "--list-backups"])
+        assert result.exit_code == 0
+        assert "No backups available" in result.output
 
+@pytest.mark.xdist_group("cli_commands")
 class TestValidateCommand:
     """Test the validate command functionality."""
 
-    def test_validate_command_valid_theme(self, cli_runner, sample_themes):
+    def test_validate_command_valid_theme(
+        self, cli_runner, sample_themes, mock_manager
+    ):
         """Test validate command with a valid theme."""
         validation_result = ValidationResult(valid=True)
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager.parser.validate_theme.return_value = validation_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager.discover_themes.return_value = sample_themes
+        mock_manager.parser.validate_theme.return_value = validation_result
 
-            result = cli_runner.invoke(cli, ["validate", "Adwaita-dark"])
-            assert result.exit_code == 0
-            assert "✓ Theme 'Adwaita-dark' is valid" in result.output
+        result = _invoke(cli_runner, ["validate", "Adwaita-dark"])
+        assert result.exit_code == 0
+        assert "✓ Theme 'Adwaita-dark' is valid" in result.output
 
-    def test_validate_command_invalid_theme(self, cli_runner, sample_themes):
+    def test_validate_command_invalid_theme(
+        self, cli_runner, sample_themes, mock_manager
+    ):
         """Test validate command with an invalid theme."""
         validation_result = ValidationResult(
             valid=False,
@@ -576,34 +528,26 @@ class TestValidateCommand:
             ],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager.parser.validate_theme.return_value = validation_result
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["validate", "Adwaita-dark"])
-            # Invalid themes should exit with code 1
-            assert result.exit_code == 1
-            assert "✗ Theme 'Adwaita-dark' has issues" in result.output
-            assert "Invalid theme format" in result.output
-
-    def test_validate_command_theme_not_found(self, cli_runner):
+        mock_manager.discover_themes.return_value = sample_themes
+        mock_manager.parser.validate_theme.return_value = validation_result
+
+        result = _invoke(cli_runner, ["validate", "Adwaita-dark"])
+        # Invalid themes should exit with code 1
+        assert result.exit_code == 1
+        assert "✗ Theme 'Adwaita-dark' has issues" in result.output
+        assert "Invalid theme format" in result.output
+
+    def test_validate_command_theme_not_found(self, cli_runner, mock_manager):
         """Test validate command when theme is not found."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = {}  # No themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["validate", "NonExistentTheme"])
-            assert result.exit_code == 1
-            assert "✗ Theme 'NonExistentTheme' not found" in result.output
-
-    def test_validate_command_with_warnings(self, cli_runner, sample_themes):
+        mock_manager.discover_themes.return_value = {}  # No themes
+
+        result = _invoke(cli_runner, ["validate", "NonExistentTheme"])
+        assert result.exit_code == 1
+        assert "✗ Theme 'NonExistentTheme' not found" in result.output
+
+    def test_validate_command_with_warnings(
+        self, cli_runner, sample_themes, mock_manager
+    ):
         """Test validate command with validation warnings (should still pass)."""
         validation_result = ValidationResult(
             valid=True,  # Valid but has warnings
@@ -614,77 +558,78 @@ class TestValidateCommand:
             ],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager.parser.validate_theme.return_value = validation_result
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["validate", "Adwaita-dark"])
-            # Warnings don't cause exit code 1, only errors do
-            assert result.exit_code == 0
-            assert "✓ Theme 'Adwaita-dark' is valid" in result.output
-            assert "Missing optional files" in result.output
-
-    def test_validate_command_error_handling(self, cli_runner):
-        """Test validate command error handling."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager_class.side_effect = Exception("Mock error")
-
-            result = cli_runner.invoke(cli, ["validate", "Adwaita-dark"])
-            assert result.exit_code == 1
-            assert "Error validating theme:" in result.output
+        mock_manager.discover_themes.return_value = sample_themes
+        mock_manager.parser.validate_theme.return_value = validation_result
 
+        result = _invoke(cli_runner, ["validate", "Adwaita-dark"])
+        # Warnings don't cause exit code 1, only errors do
+        assert result.exit_code == 0
+        assert "✓ Theme 'Adwaita-dark' is valid" in result.output
+        assert "Missing optional files" in result.output
 
+@pytest.mark.xdist_group("cli_commands")
 class TestConfigOption:
     """Test the config option functionality."""
 
-    def test_config_option_passed_to_manager(self, cli_runner, sample_themes):
+    def test_config_option_passed_to_manager(
+        self, cli_runner, mock_manager, patched_manager, tmp_path
+    ):
         """Test that config option is properly passed to UnifiedThemeManager."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
-
-            # Create a temporary config file to satisfy click.Path(exists=True)
-            with cli_runner.isolated_filesystem():
-                config_path = Path("./test_config.ini")
-                config_path.touch()  # Create the file
-
-                result = cli_runner.invoke(cli, ["--config", str(config_path), "list"])
-                assert result.exit_code == 0
-
-                # Check that the manager was initialized with the config path
-                mock_manager_class.assert_called()
-                # Check last call to make sure it had the expected config_path
-                # Get the last call
-                last_call = mock_manager_class.call_args
-                if last_call:
-                    assert last_call[1]["config_path"] == config_path
-
-    def test_no_config_option(self, cli_runner, sample_themes):
+        mock_manager.discover_themes.return_value = {}
+
+        # Create a temporary config file to satisfy click.Path(exists=True);
+        # tmp_path avoids isolated_filesystem's mkdtemp/chdir/rmtree cycle.
+        config_path = tmp_path / "test_config.ini"
+        config_path.touch()  # Create the file
+
+        result = _invoke(cli_runner, ["--config", str(config_path), "list"])
+        assert result.exit_code == 0
+
+        # Check that the manager was initialized with the config path
+        patched_manager.assert_called()
+        # Check last call to make sure it had the expected config_path
+        # Get the last call
+        last_call = patched_manager.call_args
+        if last_call:
+            assert last_call[1]["config_path"] == config_path
+
+    def test_no_config_option(self, cli_runner, mock_manager, patched_manager):
         """Test behavior when no config option is provided."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.discover_themes.return_value = sample_themes
-            mock_manager_class.return_value = mock_manager
-
-            result = cli_runner.invoke(cli, ["list"])
-            assert result.exit_code == 0
+        mock_manager.discover_themes.return_value = {}
+
+        result = _invoke(cli_runner, ["list"])
+        assert result.exit_code == 0
+
+        # Check that the manager was initialized with None config path
+        call_args = patched_manager.call_args
+        assert call_args[1]["config_path"] is None
+
+
+@pytest.mark.xdist_group("cli_commands")
+class TestErrorHandling:
+    """Manager construction failures across all commands."""
+
+    @pytest.mark.parametrize(
+        "argv,msg",
+        [
+            (["list"], "Error listing themes:"),
+            (["apply_theme", "Adwaita-dark"], "✗ Error applying theme:"),
+            (["current"], "Error getting current themes:"),
+            (["rollback"], "✗ Error during rollback:"),
+            (["validate", "Adwaita-dark"], "Error validating theme:"),
+        ],
+        ids=["list", "apply", "current", "rollback", "validate"],
+    )
+    def test_command_error_handling(self, cli_runner, patched_manager, argv, msg):
+        """Each command should exit 1 with its own error message."""
+        patched_manager.side_effect = Exception("Mock error")
 
-            # Check that the manager was initialized with None config path
-            call_args = mock_manager_class.call_args
-            assert call_args[1]["config_path"] is None
+        result = cli_runner.invoke(cli, argv)
+        assert result.exit_code == 1
+        assert msg in result.output
 
 
+@pytest.mark.xdist_group("cli_commands")
 class TestArgumentParsing:
     """Test argument parsing edge cases."""
 
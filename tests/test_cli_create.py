@@ -4,54 +4,43 @@ import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from click.testing import CliRunner
+import pytest
 
 from unified_theming.cli.commands import cli
 
+# The shared session-scoped cli_runner fixture lives in conftest.py.
+
 
 class TestCreateCommand:
     """Tests for the create command."""
 
-    def test_create_basic(self):
-        """Create command should work with just a name."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "TestTheme"])
-
-        assert result.exit_code == 0
-        assert "TestTheme" in result.output
-        assert "Created valid" in result.output
-
-    def test_create_with_accent(self):
-        """Create command should accept accent color."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "AccentTheme", "--accent", "#ff5500"])
-
-        assert result.exit_code == 0
-        assert "Using accent color" in result.output
-        assert "#ff5500" in result.output
-
-    def test_create_light_variant(self):
-        """Create command should support light variant."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "LightTheme", "--variant", "light"])
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            (["create", "TestTheme"], ["TestTheme", "Created valid"]),
+            (
+                ["create", "AccentTheme", "--accent", "#ff5500"],
+                ["Using accent color", "#ff5500"],
+            ),
+            (["create", "LightTheme", "--variant", "light"], ["light"]),
+            (["create", "DarkTheme", "--variant", "dark"], ["dark"]),
+            (["create", "--help"], ["--accent", "--variant", "--output", "--apply"]),
+        ],
+        ids=["basic", "accent", "light_variant", "dark_variant", "help"],
+    )
+    def test_create_variants(self, cli_runner, args, expected):
+        """Create command variants differing only in flags and output."""
+        result = cli_runner.invoke(cli, args)
 
         assert result.exit_code == 0
-        assert "light" in result.output
+        for substring in expected:
+            assert substring in result.output
 
-    def test_create_dark_variant(self):
-        """Create command should default to dark variant."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "DarkTheme", "--variant", "dark"])
-
-        assert result.exit_code == 0
-        assert "dark" in result.output
-
-    def test_create_with_output(self, tmp_path):
+    def test_create_with_output(self, cli_runner, tmp_path):
         """Create command should save tokens to file."""
-        runner = CliRunner()
         output_file = tmp_path / "tokens.json"
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             cli, ["create", "SavedTheme", "--output", str(output_file)]
         )
 
@@ -63,37 +52,24 @@ class TestCreateCommand:
         content = json.loads(output_file.read_text())
         assert content["name"] == "SavedTheme"
 
-    def test_create_invalid_accent(self):
+    def test_create_invalid_accent(self, cli_runner):
         """Create command should reject invalid accent colors."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "BadTheme", "--accent", "notacolor"])
+        result = cli_runner.invoke(cli, ["create", "BadTheme", "--accent", "notacolor"])
 
         assert result.exit_code != 0
         assert "Invalid accent color" in result.output
 
     @patch("unified_theming.handlers.gtk_handler.GTKHandler.apply_from_tokens")
     @patch("unified_theming.handlers.qt_handler.QtHandler.apply_from_tokens")
-    def test_create_with_apply(self, mock_qt, mock_gtk):
+    def test_create_with_apply(self, mock_qt, mock_gtk, cli_runner):
         """Create command should apply theme when --apply is used."""
         mock_gtk.return_value = True
         mock_qt.return_value = True
 
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "ApplyTheme", "--apply"])
+        result = cli_runner.invoke(cli, ["create", "ApplyTheme", "--apply"])
 
         assert result.exit_code == 0
         assert "Applied to GTK" in result.output
         assert "Applied to Qt" in result.output
         mock_gtk.assert_called_once()
         mock_qt.assert_called_once()
-
-    def test_create_help(self):
-        """Create command should show help."""
-        runner = CliRunner()
-        result = runner.invoke(cli, ["create", "--help"])
-
-        assert result.exit_code == 0
-        assert "--accent" in result.output
-        assert "--variant" in result.output
-        assert "--output" in result.output
-        assert "--apply" in result.output
@@ -12,30 +12,85 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from click.testing import CliRunner
 
 from unified_theming.cli.commands import cli
 from unified_theming.core.exceptions import ThemeNotFoundError
 from unified_theming.core.types import (
+    ApplicationResult,
+    HandlerResult,
     PlannedChange,
     PlanResult,
     Toolkit,
     ValidationResult,
 )
 
+# The shared session-scoped cli_runner fixture lives in conftest.py.
 
-@pytest.fixture
-def cli_runner():
-    """Create a Click CLI runner for testing."""
-    return CliRunner()
+# Keep the module's tests on one pytest-xdist worker so the module-scoped
+# patch and plan fixtures are built once; other files distribute freely.
+pytestmark = pytest.mark.xdist_group("cli_dryrun")
+
+
+# Paths referenced by the plan fixture; built once at module load.
+_GTK_PATH = Path("/home/user/.config/gtk-4.0/gtk.css")
+_QT_PATH = Path("/home/user/.config/kdeglobals")
+
+# Everything a dry run must mention; checked in one pass so a failure
+# reports every missing token, not just the first.
+_REQUIRED_TOKENS = (
+    "Planning theme",
+    "Nord",
+    "dry-run mode",
+    "Files that would be affected",
+    "Total changes",
+    "Handler Availability",
+    "DRY-RUN MODE",
+    "No changes were made",
+)
+
+
+def _invoke(runner, args):
+    """Invoke the CLI without Click's standalone-mode wrapper.
+
+    standalone_mode=False skips the SystemExit try/except Click wraps
+    around every standalone invocation; CliRunner still records exit
+    codes from sys.exit, so the error-path tests keep working.
+    """
+    return runner.invoke(cli, args, standalone_mode=False, catch_exceptions=False)
+
+
+@pytest.fixture(scope="module")
+def patched_manager():
+    """Patch UnifiedThemeManager once for the whole module.
+
+    Patching per test re-resolves the target and rebuilds the mock class;
+    entering the patch once and resetting between tests keeps that cost
+    O(1) for the module.
+    """
+    with patch("unified_theming.core.manager.UnifiedThemeManager") as manager_class:
+        yield manager_class
 
 
 @pytest.fixture
+def mock_manager(patched_manager):
+    """A freshly reset manager instance wired as the patched class's
+    return value."""
+    patched_manager.reset_mock(return_value=True, side_effect=True)
+    patched_manager.side_effect = None
+    manager = patched_manager.return_value
+    return manager
+
+
+@pytest.fixture(scope="module")
 def mock_plan_result():
-    """Create a mock PlanResult for testing."""
+    """Create a mock PlanResult once per module.
+
+    No test mutates the plan, so the object graph (two PlannedChanges,
+    ValidationResult, PlanResult) is built once instead of per test.
+    """
     change1 = PlannedChange(
         handler_name="gtk",
-        file_path=Path("/home/user/.config/gtk-4.0/gtk.css"),
+        file_path=_GTK_PATH,
         change_type="modify",
         description="Update GTK4 color scheme",
         current_value="@define-color theme_bg_color #ffffff;",
@@ -45,7 +100,7 @@ def mock_plan_result():
 
     change2 = PlannedChange(
         handler_name="qt",
-        file_path=Path("/home/user/.config/kdeglobals"),
+        file_path=_QT_PATH,
         change_type="create",
         description="Create Qt theme configuration",
         current_value=None,
@@ -53,8 +108,7 @@ def mock_plan_result():
         toolkit=Toolkit.QT5,
     )
 
-    validation = ValidationResult(valid=True)
-    validation.add_info("Theme structure is valid")
+    validation = ValidationResult(valid=True, infos=("Theme structure is valid",))
 
     plan_result = PlanResult(
         theme_name="Nord",
@@ -67,222 +121,185 @@ def mock_plan_result():
     return plan_result
 
 
+@pytest.fixture(scope="module")
+def mock_apply_result():
+    """Successful ApplicationResult shared by the normal-mode tests."""
+    return ApplicationResult(
+        theme_name="Nord",
+        overall_success=True,
+        handler_results={
+            "gtk": HandlerResult(
+                handler_name="gtk",
+                toolkit=Toolkit.GTK4,
+                success=True,
+                message="Applied successfully",
+            )
+        },
+    )
+
+
 class TestDryRunBasicFunctionality:
     """Test basic dry-run functionality."""
 
     def test_dry_run_flag_exists(self, cli_runner):
         """Test that --dry-run flag is recognized by the CLI."""
-        result = cli_runner.invoke(cli, ["apply_theme", "--help"])
+        result = _invoke(cli_runner, ["apply_theme", "--help"])
         assert result.exit_code == 0
         assert "--dry-run" in result.output
         assert "Preview changes without applying" in result.output
 
-    def test_dry_run_calls_plan_changes(self, cli_runner, mock_plan_result):
+    def test_dry_run_calls_plan_changes(self, cli_runner, mock_manager, mock_plan_result):
         """Test that dry-run mode calls plan_changes instead of apply_theme."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
-
-            # Verify plan_changes was called
-            mock_manager.plan_changes.assert_called_once_with("Nord", targets=None)
-            # Verify apply_theme was NOT called
-            mock_manager.apply_theme.assert_not_called()
-            assert result.exit_code == 0
-
-    def test_dry_run_no_system_modifications(self, cli_runner, mock_plan_result):
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
+
+        # Verify plan_changes was called
+        mock_manager.plan_changes.assert_called_once_with("Nord", targets=None)
+        # Verify apply_theme was NOT called
+        mock_manager.apply_theme.assert_not_called()
+        assert result.exit_code == 0
+
+    def test_dry_run_no_system_modifications(
+        self, cli_runner, mock_manager, mock_plan_result
+    ):
         """Test that dry-run mode makes no system modifications."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            # Run dry-run
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
-
-            # Verify no apply operations were attempted
-            mock_manager.apply_theme.assert_not_called()
-            mock_manager.config_manager = Mock()
-            # No backup should be created
-            assert not mock_manager.config_manager.backup_current_state.called
-            assert result.exit_code == 0
-
-    def test_dry_run_output_format(self, cli_runner, mock_plan_result):
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        # Run dry-run
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
+
+        # Verify no apply operations were attempted
+        mock_manager.apply_theme.assert_not_called()
+        # No backup should be created
+        assert not mock_manager.config_manager.backup_current_state.called
+        assert result.exit_code == 0
+
+    def test_dry_run_output_format(self, cli_runner, mock_manager, mock_plan_result):
         """Test that dry-run output includes all required information."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
-
-            # Verify output contains key information
-            assert "Planning theme" in result.output
-            assert "Nord" in result.output
-            assert "dry-run mode" in result.output
-            assert "Files that would be affected" in result.output
-            assert "Total changes" in result.output
-            assert "Handler Availability" in result.output
-            assert "DRY-RUN MODE" in result.output
-            assert "No changes were made" in result.output
-            assert result.exit_code == 0
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
+
+        # Verify output contains key information
+        missing = [token for token in _REQUIRED_TOKENS if token not in result.output]
+        assert not missing, f"missing from output: {missing}"
+        assert result.exit_code == 0
 
 
 class TestDryRunWithTargets:
     """Test dry-run with specific target toolkits."""
 
-    def test_dry_run_with_single_target(self, cli_runner, mock_plan_result):
+    def test_dry_run_with_single_target(
+        self, cli_runner, mock_manager, mock_plan_result
+    ):
         """Test dry-run with a single --targets option."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(
-                cli, ["apply_theme", "Nord", "--targets", "gtk4", "--dry-run"]
-            )
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(
+            cli_runner, ["apply_theme", "Nord", "--targets", "gtk4", "--dry-run"]
+        )
 
-            # Debug output
-            print(f"\nExit code: {result.exit_code}")
-            print(f"Output: {result.output}")
-            if result.exception:
-                print(f"Exception: {result.exception}")
-            print(f"plan_changes called: {mock_manager.plan_changes.called}")
-            print(f"plan_changes call_count: {mock_manager.plan_changes.call_count}")
-            if mock_manager.plan_changes.called:
-                print(f"plan_changes call_args: {mock_manager.plan_changes.call_args}")
-
-            # Verify plan_changes was called with correct targets (gtk4 maps to gtk handler)
-            mock_manager.plan_changes.assert_called_once_with("Nord", targets=["gtk"])
-            assert result.exit_code == 0
-
-    def test_dry_run_with_multiple_targets(self, cli_runner, mock_plan_result):
+        # Verify plan_changes was called with correct targets (gtk4 maps to gtk handler)
+        mock_manager.plan_changes.assert_called_once_with("Nord", targets=["gtk"])
+        assert result.exit_code == 0
+
+    def test_dry_run_with_multiple_targets(
+        self, cli_runner, mock_manager, mock_plan_result
+    ):
         """Test dry-run with multiple --targets options."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(
-                cli,
-                [
-                    "apply_theme",
-                    "Nord",
-                    "--targets",
-                    "gtk4",
-                    "--targets",
-                    "qt5",
-                    "--dry-run",
-                ],
-            )
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(
+            cli_runner,
+            [
+                "apply_theme",
+                "Nord",
+                "--targets",
+                "gtk4",
+                "--targets",
+                "qt5",
+                "--dry-run",
+            ],
+        )
 
-            # Verify plan_changes was called with correct targets (gtk4->gtk, qt5->qt)
-            mock_manager.plan_changes.assert_called_once()
-            call_args = mock_manager.plan_changes.call_args
-            assert call_args[0] == ("Nord",)
-            assert set(call_args[1]["targets"]) == {"gtk", "qt"}
-            assert result.exit_code == 0
+        # Verify plan_changes was called with correct targets (gtk4->gtk, qt5->qt)
+        mock_manager.plan_changes.assert_called_once()
+        call_args = mock_manager.plan_changes.call_args
+        assert call_args[0] == ("Nord",)
+        assert set(call_args[1]["targets"]) == {"gtk", "qt"}
+        assert result.exit_code == 0
 
-    def test_dry_run_with_all_target(self, cli_runner, mock_plan_result):
+    def test_dry_run_with_all_target(self, cli_runner, mock_manager, mock_plan_result):
         """Test dry-run with 'all' target."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(
-                cli, ["apply_theme", "Nord", "--targets", "all", "--dry-run"]
-            )
+        mock_manager.plan_changes.return_value = mock_plan_result
 
-            # When 'all' is specified, it maps to all handlers
-            mock_manager.plan_changes.assert_called_once_with(
-                "Nord", targets=["gtk", "qt", "flatpak", "snap"]
-            )
-            assert result.exit_code == 0
+        result = _invoke(
+            cli_runner, ["apply_theme", "Nord", "--targets", "all", "--dry-run"]
+        )
+
+        # When 'all' is specified, it maps to all handlers
+        mock_manager.plan_changes.assert_called_once_with(
+            "Nord", targets=["gtk", "qt", "flatpak", "snap"]
+        )
+        assert result.exit_code == 0
 
 
 class TestDryRunDataContracts:
     """Test data contracts between CLI and manager."""
 
-    def test_plan_result_structure(self, cli_runner, mock_plan_result):
+    def test_plan_result_structure(self, cli_runner, mock_manager, mock_plan_result):
         """Test that PlanResult data structure is correctly processed."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
+        mock_manager.plan_changes.return_value = mock_plan_result
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
 
-            # Verify all PlanResult fields are used
-            assert str(mock_plan_result.estimated_files_affected) in result.output
-            assert str(len(mock_plan_result.planned_changes)) in result.output
-            assert result.exit_code == 0
+        # Verify all PlanResult fields are used
+        assert str(mock_plan_result.estimated_files_affected) in result.output
+        assert str(len(mock_plan_result.planned_changes)) in result.output
+        assert result.exit_code == 0
 
-    def test_planned_change_display(self, cli_runner, mock_plan_result):
+    def test_planned_change_display(self, cli_runner, mock_manager, mock_plan_result):
         """Test that PlannedChange objects are correctly displayed."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
-
-            # Verify planned changes are displayed
-            assert "Planned Changes" in result.output
-            assert "gtk:" in result.output
-            assert "qt:" in result.output
-            # Verify change details
-            for change in mock_plan_result.planned_changes:
-                assert str(change.file_path) in result.output
-                assert change.description in result.output
-            assert result.exit_code == 0
-
-    def test_handler_availability_display(self, cli_runner, mock_plan_result):
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
+
+        # Verify planned changes and their details are displayed
+        expected = ["Planned Changes", "gtk:", "qt:"]
+        for change in mock_plan_result.planned_changes:
+            expected += [str(change.file_path), change.description]
+        missing = [token for token in expected if token not in result.output]
+        assert not missing, f"missing from output: {missing}"
+        assert result.exit_code == 0
+
+    def test_handler_availability_display(
+        self, cli_runner, mock_manager, mock_plan_result
+    ):
         """Test that handler availability is correctly displayed."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
-
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord", "--dry-run"])
-
-            # Verify handler availability is shown
-            assert "Handler Availability" in result.output
-            assert "gtk: ✓ Available" in result.output
-            assert "qt: ✓ Available" in result.output
-            assert (
-                "flatpak: ✗ Not available" in result.output
-                or "snap: ✗ Not available" in result.output
-            )
-            assert result.exit_code == 0
+        mock_manager.plan_changes.return_value = mock_plan_result
+
+        result = _invoke(cli_runner, ["apply_theme", "Nord", "--dry-run"])
+
+        # Verify handler availability is shown
+        expected = ["Handler Availability", "gtk: ✓ Available", "qt: ✓ Available"]
+        missing = [token for token in expected if token not in result.output]
+        assert not missing, f"missing from output: {missing}"
+        assert (
+            "flatpak: ✗ Not available" in result.output
+            or "snap: ✗ Not available" in result.output
+        )
+        assert result.exit_code == 0
 
-    def test_validation_messages_display(self, cli_runner):
+    def test_validation_messages_display(self, cli_runner, mock_manager):
         """Test that validation messages are correctly displayed."""
         # Create plan result with validation messages
-        validation = ValidationResult(valid=False)
-        validation.add_error("Missing required color variable")
-        validation.add_warning("Theme may not support all features")
-        validation.add_info("Theme structure is valid")
+        validation = ValidationResult(
+            valid=False,
+            errors=("Missing required color variable",),
+            warnings=("Theme may not support all features",),
+            infos=("Theme structure is valid",),
+        )
 
         plan_result = PlanResult(
             theme_name="TestTheme",
@@ -292,64 +309,49 @@ class TestDryRunDataContracts:
             warnings=[],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = plan_result
+        mock_manager.plan_changes.return_value = plan_result
 
-            result = cli_runner.invoke(cli, ["apply_theme", "TestTheme", "--dry-run"])
+        result = _invoke(cli_runner, ["apply_theme", "TestTheme", "--dry-run"])
 
-            # Verify validation messages are displayed
-            assert "Validation:" in result.output
-            assert "[ERROR]" in result.output
-            assert "[WARNING]" in result.output
-            assert "[INFO]" in result.output
-            assert "Missing required color variable" in result.output
-            assert result.exit_code == 0
+        # Verify validation messages are displayed
+        assert "Validation:" in result.output
+        assert "[ERROR]" in result.output
+        assert "[WARNING]" in result.output
+        assert "[INFO]" in result.output
+        assert "Missing required color variable" in result.output
+        assert result.exit_code == 0
 
 
 class TestDryRunErrorHandling:
     """Test error handling in dry-run mode."""
 
-    def test_theme_not_found_error(self, cli_runner):
+    def test_theme_not_found_error(self, cli_runner, mock_manager):
         """Test handling of ThemeNotFoundError in dry-run mode."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.side_effect = ThemeNotFoundError(
-                "NonExistentTheme", searched_paths=[Path("/usr/share/themes")]
-            )
+        mock_manager.plan_changes.side_effect = ThemeNotFoundError(
+            "NonExistentTheme", searched_paths=[Path("/usr/share/themes")]
+        )
 
-            result = cli_runner.invoke(
-                cli, ["apply_theme", "NonExistentTheme", "--dry-run"]
-            )
+        result = _invoke(
+            cli_runner, ["apply_theme", "NonExistentTheme", "--dry-run"]
+        )
 
-            # Verify error is displayed
-            assert result.exit_code == 1
-            assert "Error applying theme" in result.output
-            assert "NonExistentTheme" in result.output
+        # Verify error is displayed
+        assert result.exit_code == 1
+        assert "Error applying theme" in result.output
+        assert "NonExistentTheme" in result.output
 
-    def test_generic_exception_handling(self, cli_runner):
+    def test_generic_exception_handling(self, cli_runner, mock_manager):
         """Test handling of generic exceptions in dry-run mode."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.side_effect = Exception("Unexpected error")
+        mock_manager.plan_changes.side_effect = Exception("Unexpected error")
 
-            result = cli_runner.invoke(cli, ["apply_theme", "TestTheme", "--dry-run"])
+        result = _invoke(cli_runner, ["apply_theme", "TestTheme", "--dry-run"])
 
-            # Verify error is displayed
-            assert result.exit_code == 1
-            assert "Error applying theme" in result.output
-            assert "Unexpected error" in result.output
+        # Verify error is displayed
+        assert result.exit_code == 1
+        assert "Error applying theme" in result.output
+        assert "Unexpected error" in result.output
 
-    def test_empty_planned_changes(self, cli_runner):
+    def test_empty_planned_changes(self, cli_runner, mock_manager):
         """Test handling of empty planned changes."""
         plan_result = PlanResult(
             theme_name="EmptyTheme",
@@ -359,24 +361,19 @@ class TestDryRunErrorHandling:
             warnings=[],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = plan_result
+        mock_manager.plan_changes.return_value = plan_result
 
-            result = cli_runner.invoke(cli, ["apply_theme", "EmptyTheme", "--dry-run"])
+        result = _invoke(cli_runner, ["apply_theme", "EmptyTheme", "--dry-run"])
 
-            # Verify appropriate message is displayed
-            assert "No changes would be made" in result.output
-            assert result.exit_code == 0
+        # Verify appropriate message is displayed
+        assert "No changes would be made" in result.output
+        assert result.exit_code == 0
 
 
 class TestDryRunWarnings:
     """Test warning display in dry-run mode."""
 
-    def test_warnings_display(self, cli_runner):
+    def test_warnings_display(self, cli_runner, mock_manager):
         """Test that warnings are correctly displayed."""
         plan_result = PlanResult(
             theme_name="TestTheme",
@@ -389,125 +386,76 @@ class TestDryRunWarnings:
             ],
         )
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = plan_result
+        mock_manager.plan_changes.return_value = plan_result
 
-            result = cli_runner.invoke(cli, ["apply_theme", "TestTheme", "--dry-run"])
+        result = _invoke(cli_runner, ["apply_theme", "TestTheme", "--dry-run"])
 
-            # Verify warnings are displayed
-            assert "Warnings:" in result.output
-            assert "Handler qt is not available" in result.output
-            assert "Some theme features may not be supported" in result.output
-            assert result.exit_code == 0
+        # Verify warnings are displayed
+        assert "Warnings:" in result.output
+        assert "Handler qt is not available" in result.output
+        assert "Some theme features may not be supported" in result.output
+        assert result.exit_code == 0
 
 
 class TestDryRunVerbosity:
     """Test dry-run with different verbosity levels."""
 
-    def test_dry_run_with_verbose_flag(self, cli_runner, mock_plan_result):
+    def test_dry_run_with_verbose_flag(self, cli_runner, mock_manager, mock_plan_result):
         """Test dry-run with -v flag."""
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
+        mock_manager.plan_changes.return_value = mock_plan_result
 
-            result = cli_runner.invoke(cli, ["-v", "apply_theme", "Nord", "--dry-run"])
+        result = _invoke(cli_runner, ["-v", "apply_theme", "Nord", "--dry-run"])
 
-            # Verbosity should still work in dry-run mode
-            assert result.exit_code == 0
-            assert "Planning theme" in result.output
+        # Verbosity should still work in dry-run mode
+        assert result.exit_code == 0
+        assert "Planning theme" in result.output
 
-    def test_dry_run_with_config_path(self, cli_runner, mock_plan_result, tmp_path):
+    def test_dry_run_with_config_path(
+        self, cli_runner, mock_manager, patched_manager, mock_plan_result, tmp_path
+    ):
         """Test dry-run with custom config path."""
         config_file = tmp_path / "config.json"
         config_file.write_text("{}")
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.plan_changes.return_value = mock_plan_result
+        mock_manager.plan_changes.return_value = mock_plan_result
 
-            result = cli_runner.invoke(
-                cli, ["--config", str(config_file), "apply_theme", "Nord", "--dry-run"]
-            )
+        result = _invoke(
+            cli_runner, ["--config", str(config_file), "apply_theme", "Nord", "--dry-run"]
+        )
 
-            # Verify config path was passed to manager
-            mock_manager_class.assert_called_once()
-            call_kwargs = mock_manager_class.call_args[1]
-            assert "config_path" in call_kwargs
-            assert result.exit_code == 0
+        # Verify config path was passed to manager
+        patched_manager.assert_called_once()
+        call_kwargs = patched_manager.call_args[1]
+        assert "config_path" in call_kwargs
+        assert result.exit_code == 0
 
 
 class TestNormalModeUnaffected:
     """Test that normal apply mode is unaffected by dry-run implementation."""
 
-    def test_apply_without_dry_run_calls_apply_theme(self, cli_runner):
+    def test_apply_without_dry_run_calls_apply_theme(
+        self, cli_runner, mock_manager, mock_apply_result
+    ):
         """Test that normal mode still calls apply_theme."""
-        from unified_theming.core.types import ApplicationResult, HandlerResult, Toolkit
-
-        mock_result = ApplicationResult(
-            theme_name="Nord",
-            overall_success=True,
-            handler_results={
-                "gtk": HandlerResult(
-                    handler_name="gtk",
-                    toolkit=Toolkit.GTK4,
-                    success=True,
-                    message="Applied successfully",
-                )
-            },
-        )
-
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.apply_theme.return_value = mock_result
+        mock_manager.apply_theme.return_value = mock_apply_result
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord"])
+        result = _invoke(cli_runner, ["apply_theme", "Nord"])
 
-            # Verify apply_theme was called
-            mock_manager.apply_theme.assert_called_once_with("Nord", targets=None)
-            # Verify plan_changes was NOT called
-            mock_manager.plan_changes.assert_not_called()
-            assert result.exit_code == 0
+        # Verify apply_theme was called
+        mock_manager.apply_theme.assert_called_once_with("Nord", targets=None)
+        # Verify plan_changes was NOT called
+        mock_manager.plan_changes.assert_not_called()
+        assert result.exit_code == 0
 
-    def test_apply_without_dry_run_shows_success(self, cli_runner):
+    def test_apply_without_dry_run_shows_success(
+        self, cli_runner, mock_manager, mock_apply_result
+    ):
         """Test that normal mode shows success messages."""
-        from unified_theming.core.types import ApplicationResult, HandlerResult, Toolkit
-
-        mock_result = ApplicationResult(
-            theme_name="Nord",
-            overall_success=True,
-            handler_results={
-                "gtk": HandlerResult(
-                    handler_name="gtk",
-                    toolkit=Toolkit.GTK4,
-                    success=True,
-                    message="Applied successfully",
-                )
-            },
-        )
+        mock_manager.apply_theme.return_value = mock_apply_result
 
-        with patch(
-            "unified_theming.cli.commands.UnifiedThemeManager"
-        ) as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager_class.return_value = mock_manager
-            mock_manager.apply_theme.return_value = mock_result
+        result = _invoke(cli_runner, ["apply_theme", "Nord"])
 
-            result = cli_runner.invoke(cli, ["apply_theme", "Nord"])
-
-            # Verify success messages
-            assert "Theme 'Nord' applied successfully" in result.output
-            assert "DRY-RUN MODE" not in result.output
-            assert result.exit_code == 0
+        # Verify success messages
+        assert "Theme 'Nord' applied successfully" in result.output
+        assert "DRY-RUN MODE" not in result.output
+        assert result.exit_code == 0
@@ -4,69 +4,50 @@ import math
 
 import pytest
 
-from unified_theming.color.spaces import Color, OKLCHColor
+from unified_theming.color.spaces import Color, OKLCHColor, batch_to_oklch
 
 
 class TestColorFromHex:
     """Test hex parsing."""
 
-    def test_six_digit_hex(self):
-        c = Color.from_hex("#ff5500")
-        assert c.r == 255
-        assert c.g == 85
-        assert c.b == 0
-        assert c.a == 1.0
-
-    def test_three_digit_hex(self):
-        c = Color.from_hex("#f50")
-        assert c.r == 255
-        assert c.g == 85
-        assert c.b == 0
-
-    def test_eight_digit_hex_with_alpha(self):
-        c = Color.from_hex("#ff550080")
-        assert c.r == 255
-        assert c.g == 85
-        assert c.b == 0
-        assert c.a == pytest.approx(0.502, rel=0.01)
-
-    def test_no_hash_prefix(self):
-        c = Color.from_hex("3584e4")
-        assert c.r == 53
-        assert c.g == 132
-        assert c.b == 228
-
-    def test_lowercase_hex(self):
-        c = Color.from_hex("#aabbcc")
-        assert c.r == 170
-        assert c.g == 187
-        assert c.b == 204
+    @pytest.mark.parametrize(
+        "hex_in,r,g,b,a",
+        [
+            pytest.param("#ff5500", 255, 85, 0, 1.0, id="six_digit"),
+            pytest.param("#f50", 255, 85, 0, 1.0, id="three_digit"),
+            pytest.param("#ff550080", 255, 85, 0, 0.502, id="eight_digit_alpha"),
+            pytest.param("3584e4", 53, 132, 228, 1.0, id="no_hash_prefix"),
+            pytest.param("#aabbcc", 170, 187, 204, 1.0, id="lowercase"),
+        ],
+    )
+    def test_from_hex(self, hex_in, r, g, b, a):
+        c = Color.from_hex(hex_in)
+        assert c.r == r
+        assert c.g == g
+        assert c.b == b
+        assert c.a == pytest.approx(a, rel=0.01)
 
 
 class TestColorToHex:
     """Test hex output."""
 
+    @pytest.mark.parametrize(
+        "color,expected",
+        [
+            pytest.param(Color(255, 0, 0, 0.5), "#ff00007f", id="with_alpha"),
+            pytest.param(Color(255, 0, 0, 1.0), "#ff0000", id="full_alpha_no_suffix"),
+            pytest.param(Color(0, 0, 0), "#000000", id="black"),
+            pytest.param(Color(255, 255, 255), "#ffffff", id="white"),
+        ],
+    )
+    def test_to_hex(self, color, expected):
+        assert color.to_hex() == expected
+
     def test_roundtrip_six_digit(self):
         original = "#3584e4"
         c = Color.from_hex(original)
         assert c.to_hex() == original
 
-    def test_with_alpha(self):
-        c = Color(255, 0, 0, 0.5)
-        assert c.to_hex() == "#ff00007f"  # 0.5 * 255 = 127 = 0x7f
-
-    def test_full_alpha_no_suffix(self):
-        c = Color(255, 0, 0, 1.0)
-        assert c.to_hex() == "#ff0000"
-
-    def test_black(self):
-        c = Color(0, 0, 0)
-        assert c.to_hex() == "#000000"
-
-    def test_white(self):
-        c = Color(255, 255, 255)
-        assert c.to_hex() == "#ffffff"
-
 
 class TestLinearRGB:
     """Test gamma correction."""
@@ -95,25 +76,22 @@ class TestLinearRGB:
 class TestLuminance:
     """Test WCAG luminance calculation."""
 
-    def test_white_luminance(self):
-        c = Color(255, 255, 255)
-        assert c.luminance() == pytest.approx(1.0, rel=0.01)
-
-    def test_black_luminance(self):
-        c = Color(0, 0, 0)
-        assert c.luminance() == 0
-
-    def test_red_luminance(self):
-        c = Color(255, 0, 0)
-        assert c.luminance() == pytest.approx(0.2126, rel=0.01)
-
-    def test_green_luminance(self):
-        c = Color(0, 255, 0)
-        assert c.luminance() == pytest.approx(0.7152, rel=0.01)
-
-    def test_blue_luminance(self):
-        c = Color(0, 0, 255)
-        assert c.luminance() == pytest.approx(0.0722, rel=0.01)
+    @pytest.mark.parametrize(
+        "hex_in,expected",
+        [
+            pytest.param("#ffffff", 1.0, id="white"),
+            pytest.param("#000000", 0.0, id="black"),
+            pytest.param("#ff0000", 0.2126, id="red"),
+            pytest.param("#00ff00", 0.7152, id="green"),
+            pytest.param("#0000ff", 0.0722, id="blue"),
+        ],
+    )
+    def test_luminance(self, hex_in, expected):
+        c = Color.from_hex(hex_in)
+        if expected == 0.0:
+            assert c.luminance() == 0
+        else:
+            assert c.luminance() == pytest.approx(expected, rel=0.01)
 
 
 class TestOKLCHConversion:
@@ -175,34 +153,42 @@ class TestOKLCHConversion:
             assert abs(roundtrip.g - original.g) <= 1
             assert abs(roundtrip.b - original.b) <= 1
 
+    def test_batch_matches_scalar(self):
+        """batch_to_oklch should agree with per-color to_oklch."""
+        colors = [Color(255, 0, 0), Color(0, 255, 0), Color(53, 132, 228)]
+        batched = batch_to_oklch(colors)
+        for color, oklch in zip(colors, batched):
+            expected = color.to_oklch()
+            assert oklch.lightness == pytest.approx(expected.lightness)
+            assert oklch.chroma == pytest.approx(expected.chroma)
+            assert oklch.hue == pytest.approx(expected.hue)
+
 
 class TestOKLCHOperations:
     """Test OKLCH manipulation methods."""
 
-    def test_with_lightness(self):
-        oklch = OKLCHColor(0.5, 0.1, 180)
-        lighter = oklch.with_lightness(0.8)
-        assert lighter.lightness == 0.8
-        assert lighter.chroma == 0.1
-        assert lighter.hue == 180
-
-    def test_with_lightness_clamped(self):
-        oklch = OKLCHColor(0.5, 0.1, 180)
-        assert oklch.with_lightness(1.5).lightness == 1.0
-        assert oklch.with_lightness(-0.5).lightness == 0.0
-
-    def test_with_chroma(self):
-        oklch = OKLCHColor(0.5, 0.1, 180)
-        saturated = oklch.with_chroma(0.2)
-        assert saturated.chroma == 0.2
-        assert saturated.lightness == 0.5
-
-    def test_rotate_hue(self):
-        oklch = OKLCHColor(0.5, 0.1, 90)
-        rotated = oklch.rotate_hue(180)
-        assert rotated.hue == 270
-
-    def test_rotate_hue_wraps(self):
-        oklch = OKLCHColor(0.5, 0.1, 300)
-        rotated = oklch.rotate_hue(120)
-        assert rotated.hue == 60
+    @pytest.fixture
+    def base(self):
+        return OKLCHColor(0.5, 0.1, 180)
+
+    @pytest.mark.parametrize(
+        "method,arg,attr,expected",
+        [
+            pytest.param("with_lightness", 0.8, "lightness", 0.8, id="with_lightness"),
+            pytest.param("with_lightness", 1.5, "lightness", 1.0, id="lightness_clamped_high"),
+            pytest.param("with_lightness", -0.5, "lightness", 0.0, id="lightness_clamped_low"),
+            pytest.param("with_chroma", 0.2, "chroma", 0.2, id="with_chroma"),
+            pytest.param("rotate_hue", 90, "hue", 270, id="rotate_hue"),
+            pytest.param("rotate_hue", 240, "hue", 60, id="rotate_hue_wraps"),
+        ],
+    )
+    def test_operation(self, base, method, arg, attr, expected):
+        result = getattr(base, method)(arg)
+        assert getattr(result, attr) == expected
+
+    def test_operations_preserve_other_components(self, base):
+        lighter = base.with_lightness(0.8)
+        assert lighter.chroma == base.chroma
+        assert lighter.hue == base.hue
+        saturated = base.with_chroma(0.2)
+        assert saturated.lightness == base.lightness
@@ -26,41 +26,8 @@ from unified_theming.utils.color import (
 )
 
 
-# Fixtures for common test data
-@pytest.fixture
-def sample_colors():
-    """Valid colors in all formats for color.py testing."""
-    return {
-        "hex6": "#FF5733",
-        "hex3": "#F57",
-        "rgb": "rgb(255, 87, 51)",
-        "rgba": "rgba(255, 87, 51, 0.5)",
-        "hsl": "hsl(9, 100%, 60%)",
-        "named": "red",
-    }
-
-
-@pytest.fixture
-def invalid_colors():
-    """Malformed color strings for validation testing."""
-    return [
-        "not-a-color",
-        "#FF57",  # Wrong length
-        "rgb(300, 87, 51)",  # Out of range
-        "rgba(255, 87, 51)",  # Missing alpha
-        "",  # Empty
-    ]
-
-
-@pytest.fixture
-def gtk_color_variables():
-    """Mock GTK CSS with @define-color definitions."""
-    return {
-        "theme_bg_color": "#FFFFFF",
-        "theme_fg_color": "#000000",
-        "theme_selected_bg_color": "#3584E4",
-        "theme_selected_fg_color": "#FFFFFF",
-    }
+# Common color test data lives in conftest.py as session-scoped fixtures
+# (sample_colors, invalid_colors, gtk_color_variables).
 
 
 # Test Cases for normalize_color_format (TC-C-001 to TC-C-008)
@@ -28,6 +28,13 @@ class TestContrastRatio:
         red = Color(255, 0, 0)
         assert wcag.contrast_ratio(white, red) == pytest.approx(4.0, rel=0.05)
 
+    def test_bulk_matches_scalar(self):
+        """contrast_ratios_bulk should agree with per-pair contrast_ratio."""
+        bg = Color(255, 255, 255)
+        fgs = [Color(0, 0, 0), Color(255, 0, 0), Color(53, 132, 228)]
+        for fg, ratio in zip(fgs, wcag.contrast_ratios_bulk(fgs, bg)):
+            assert ratio == pytest.approx(wcag.contrast_ratio(fg, bg))
+
 
 class TestMeetsAA:
     """Test WCAG AA compliance."""
@@ -102,10 +102,10 @@ def test_gui_prototype_threading():
 
     content = gui_path.read_text()
 
-    # Check for threading usage
+    # Check for background-work plumbing
     assert "import threading" in content
-    assert "threading.Thread" in content
-    assert "daemon=True" in content
+    assert "ThreadPoolExecutor" in content
+    assert "max_workers=1" in content
     assert "GLib.idle_add" in content
 
 
@@ -11,9 +11,12 @@ from typing import List, Optional, Tuple
 
 import click
 
-from unified_theming.core.manager import UnifiedThemeManager
 from unified_theming.core.types import Toolkit
 
+# UnifiedThemeManager pulls in the parser, config manager, and every handler
+# module; importing it lazily inside the commands that need it keeps
+# `--help`, `--version`, and argument-error paths off that import cost.
+
 
 def map_toolkits_to_handlers(targets: Tuple[str, ...]) -> tuple[List[str], List[str]]:
     """
@@ -128,6 +131,8 @@ def list(ctx, targets: Tuple[str, ...], format: str):
         unified-theming list --format json
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
         themes = manager.discover_themes()
 
@@ -219,6 +224,8 @@ def apply(
         unified-theming apply_theme --from-tokens tokens.json
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
 
         # Map targets to handler names
@@ -381,6 +388,8 @@ def convert(ctx, theme_name: str, output: Path):
         unified-theming convert Adwaita-dark --output tokens.json
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
         tokens = manager.convert_theme_to_tokens(theme_name)
         output.parent.mkdir(parents=True, exist_ok=True)
@@ -421,6 +430,8 @@ def render(ctx, token_file: Path, target: str, output: Path):
         unified-theming render tokens.json --target gtk --output ./out
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
         written = manager.render_tokens(token_file, target, output)
         click.secho(
@@ -458,6 +469,8 @@ def current(ctx, format: str):
         unified-theming current --format json
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
         current_themes = manager.get_current_themes()
 
@@ -504,6 +517,8 @@ def rollback(ctx, list_backups: bool):
         unified-theming rollback --list-backups
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
 
         if list_backups:
@@ -555,6 +570,8 @@ def validate(ctx, theme_name: str):
         unified-theming validate Nord
     """
     try:
+        from unified_theming.core.manager import UnifiedThemeManager
+
         manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
         themes = manager.discover_themes()
 
@@ -781,6 +798,8 @@ def create(
         # Apply if requested
         if apply:
             click.echo("Applying theme...")
+            from unified_theming.core.manager import UnifiedThemeManager
+
             manager = UnifiedThemeManager(config_path=ctx.obj.get("config"))
 
             from unified_theming.handlers.gtk_handler import GTKHandler
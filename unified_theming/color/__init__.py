@@ -1,13 +1,21 @@
 """Color utilities with perceptual OKLCH support and WCAG accessibility."""
 
 from .operations import derive_hover, derive_pressed
-from .spaces import Color, OKLCHColor
-from .wcag import contrast_ratio, ensure_contrast, meets_aa, meets_aaa
+from .spaces import Color, OKLCHColor, batch_to_oklch
+from .wcag import (
+    contrast_ratio,
+    contrast_ratios_bulk,
+    ensure_contrast,
+    meets_aa,
+    meets_aaa,
+)
 
 __all__ = [
     "Color",
     "OKLCHColor",
+    "batch_to_oklch",
     "contrast_ratio",
+    "contrast_ratios_bulk",
     "derive_hover",
     "derive_pressed",
     "ensure_contrast",
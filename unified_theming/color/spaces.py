@@ -2,10 +2,35 @@
 
 import math
 from dataclasses import dataclass
-from typing import Tuple
-
-
-@dataclass
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+try:
+    from math import cbrt as _cbrt  # Python 3.11+: one libm call, handles negatives
+except ImportError:  # pragma: no cover - Python 3.10
+
+    def _cbrt(x: float) -> float:
+        return math.copysign(abs(x) ** (1 / 3), x)
+
+# Two-hex-digit pairs -> int, covering every case combination. Parsing a hex
+# color then costs three or four dict lookups instead of int(s, 16) calls
+# through Python's generic base-N string parser.
+_HEX2 = {}
+for _i in range(256):
+    _lo = format(_i, "02x")
+    for _pair in {_lo, _lo.upper(), _lo[0] + _lo[1].upper(), _lo[0].upper() + _lo[1]}:
+        _HEX2[_pair] = _i
+del _i, _lo, _pair
+
+# sRGB channel (0-255) -> linear value. Channels are always 8-bit here, so
+# gamma expansion collapses to one tuple index instead of a pow() per channel.
+_SRGB_TO_LINEAR = tuple(
+    (c / 255) / 12.92 if c / 255 <= 0.04045 else ((c / 255 + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Color:
     """Perceptually-aware color in sRGB space (0-255)."""
 
@@ -15,10 +40,12 @@ class Color:
     a: float = 1.0
 
     @classmethod
+    @lru_cache(maxsize=512)
     def from_hex(cls, hex_str: str) -> "Color":
         """Parse hex color string to Color object.
 
-        Supports #RGB, #RRGGBB, and #RRGGBBAA formats.
+        Supports #RGB, #RRGGBB, and #RRGGBBAA formats. Results are
+        memoized; instances are frozen, so sharing them is safe.
 
         Args:
             hex_str: Hex color string starting with '#'.
@@ -38,9 +65,12 @@ class Color:
         """
         h = hex_str.lstrip("#")
         if len(h) == 3:
-            h = "".join(c * 2 for c in h)
-        r, g, b = int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16)
-        a = int(h[6:8], 16) / 255 if len(h) == 8 else 1.0
+            h = h[0] * 2 + h[1] * 2 + h[2] * 2
+        try:
+            r, g, b = _HEX2[h[0:2]], _HEX2[h[2:4]], _HEX2[h[4:6]]
+            a = _HEX2[h[6:8]] / 255 if len(h) == 8 else 1.0
+        except KeyError:
+            raise ValueError(f"invalid hex color: {hex_str!r}")
         return cls(r, g, b, a)
 
     def to_hex(self) -> str:
@@ -64,12 +94,11 @@ class Color:
 
     def to_linear_rgb(self) -> Tuple[float, float, float]:
         """Convert sRGB to linear RGB (gamma correction)."""
-
-        def linearize(c: int) -> float:
-            v = c / 255
-            return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
-
-        return linearize(self.r), linearize(self.g), linearize(self.b)
+        return (
+            _SRGB_TO_LINEAR[self.r],
+            _SRGB_TO_LINEAR[self.g],
+            _SRGB_TO_LINEAR[self.b],
+        )
 
     def luminance(self) -> float:
         """Calculate WCAG relative luminance (0.0 to 1.0).
@@ -87,8 +116,11 @@ class Color:
             >>> Color(128, 128, 128).luminance()
             0.2126
         """
-        lr, lg, lb = self.to_linear_rgb()
-        return 0.2126 * lr + 0.7152 * lg + 0.0722 * lb
+        return (
+            0.2126 * _SRGB_TO_LINEAR[self.r]
+            + 0.7152 * _SRGB_TO_LINEAR[self.g]
+            + 0.0722 * _SRGB_TO_LINEAR[self.b]
+        )
 
     def to_oklch(self) -> "OKLCHColor":
         """Convert sRGB Color to OKLCH perceptual color space.
@@ -100,29 +132,10 @@ class Color:
             >>> Color(255, 0, 0).to_oklch()
             OKLCHColor(lightness=0.6279553606145516, chroma=0.25768330773615674, hue=29.23388519234262)
         """
-        lr, lg, lb = self.to_linear_rgb()
-
-        # Linear RGB → Oklab (via LMS)
-        l = 0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb
-        m = 0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb
-        s = 0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb
-
-        l_ = math.copysign(abs(l) ** (1 / 3), l)
-        m_ = math.copysign(abs(m) ** (1 / 3), m)
-        s_ = math.copysign(abs(s) ** (1 / 3), s)
-
-        L = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
-        a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
-        b_val = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
-
-        # Oklab → OKLCH
-        C = math.sqrt(a * a + b_val * b_val)
-        H = math.degrees(math.atan2(b_val, a)) % 360
-
-        return OKLCHColor(L, C, H)
+        return _rgb_to_oklch(self.r, self.g, self.b)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OKLCHColor:
     """Color in OKLCH perceptual space (lightness, chroma, hue)."""
 
@@ -216,3 +229,75 @@ class OKLCHColor:
             return max(0, min(255, int(v * 255 + 0.5)))
 
         return Color(gamma(lr), gamma(lg), gamma(lb))
+
+
+@lru_cache(maxsize=512)
+def _rgb_to_oklch(r: int, g: int, b: int) -> "OKLCHColor":
+    """Memoized sRGB→OKLCH conversion.
+
+    Theme application converts the same accent and surface colors over
+    and over (once per handler, per derived shade); caching on the RGB
+    triple turns repeats into a dict lookup. Alpha does not participate
+    in the conversion, so it is not part of the key. The returned
+    instance is shared between callers — OKLCHColor operations already
+    return copies rather than mutating.
+    """
+    lr, lg, lb = _SRGB_TO_LINEAR[r], _SRGB_TO_LINEAR[g], _SRGB_TO_LINEAR[b]
+
+    # Linear RGB → Oklab (via LMS)
+    l = 0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb
+    m = 0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb
+    s = 0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb
+
+    l_ = _cbrt(l)
+    m_ = _cbrt(m)
+    s_ = _cbrt(s)
+
+    L = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+    a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+    b_val = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+
+    # Oklab → OKLCH
+    C = math.sqrt(a * a + b_val * b_val)
+    H = math.degrees(math.atan2(b_val, a)) % 360
+
+    return OKLCHColor(L, C, H)
+
+
+def batch_to_oklch(colors: Iterable[Color]) -> List[OKLCHColor]:
+    """Convert many Colors to OKLCH in one pass.
+
+    Equivalent to ``[c.to_oklch() for c in colors]`` but with the gamma
+    table and math helpers bound as locals, so bulk palette conversions
+    skip the per-color attribute and global lookups.
+
+    Args:
+        colors: Iterable of Color objects to convert.
+
+    Returns:
+        List of OKLCHColor objects in input order.
+    """
+    lut = _SRGB_TO_LINEAR
+    cbrt, sqrt, atan2, degrees = _cbrt, math.sqrt, math.atan2, math.degrees
+    out = []
+    append = out.append
+    for color in colors:
+        lr, lg, lb = lut[color.r], lut[color.g], lut[color.b]
+
+        l = 0.4122214708 * lr + 0.5363325363 * lg + 0.0514459929 * lb
+        m = 0.2119034982 * lr + 0.6806995451 * lg + 0.1073969566 * lb
+        s = 0.0883024619 * lr + 0.2817188376 * lg + 0.6299787005 * lb
+
+        l_ = cbrt(l)
+        m_ = cbrt(m)
+        s_ = cbrt(s)
+
+        L = 0.2104542553 * l_ + 0.7936177850 * m_ - 0.0040720468 * s_
+        a = 1.9779984951 * l_ - 2.4285922050 * m_ + 0.4505937099 * s_
+        b_val = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.8086757660 * s_
+
+        C = sqrt(a * a + b_val * b_val)
+        H = degrees(atan2(b_val, a)) % 360
+
+        append(OKLCHColor(L, C, H))
+    return out
@@ -1,8 +1,12 @@
 """WCAG accessibility calculations for color contrast."""
 
-from .spaces import Color
+from functools import lru_cache
+from typing import Iterable, List
 
+from .spaces import _SRGB_TO_LINEAR, Color
 
+
+@lru_cache(maxsize=4096)
 def contrast_ratio(fg: Color, bg: Color) -> float:
     """
     Calculate WCAG 2.1 contrast ratio between two colors.
@@ -28,6 +32,34 @@ def contrast_ratio(fg: Color, bg: Color) -> float:
     return (lighter + 0.05) / (darker + 0.05)
 
 
+def contrast_ratios_bulk(fgs: Iterable[Color], bg: Color) -> List[float]:
+    """Compute contrast ratios for many foregrounds against one background.
+
+    Equivalent to ``[contrast_ratio(fg, bg) for fg in fgs]`` but computes
+    the background luminance once and binds the gamma table as a local,
+    so palette-vs-background scans skip the per-color call and lookup
+    overhead.
+
+    Args:
+        fgs: Iterable of foreground colors to check.
+        bg: Background color, fixed for the whole scan.
+
+    Returns:
+        List of contrast ratios (1.0 to 21.0) in input order.
+    """
+    lut = _SRGB_TO_LINEAR
+    l_bg = 0.2126 * lut[bg.r] + 0.7152 * lut[bg.g] + 0.0722 * lut[bg.b]
+    out = []
+    append = out.append
+    for fg in fgs:
+        l_fg = 0.2126 * lut[fg.r] + 0.7152 * lut[fg.g] + 0.0722 * lut[fg.b]
+        if l_fg >= l_bg:
+            append((l_fg + 0.05) / (l_bg + 0.05))
+        else:
+            append((l_bg + 0.05) / (l_fg + 0.05))
+    return out
+
+
 def meets_aa(fg: Color, bg: Color, large_text: bool = False) -> bool:
     """
     Check if colors meet WCAG AA contrast requirements.
@@ -98,20 +130,32 @@ def ensure_contrast(fg: Color, bg: Color, min_ratio: float = 4.5) -> Color:
     if contrast_ratio(fg, bg) >= min_ratio:
         return fg
 
+    # Contrast against a fixed background is monotonic in lightness when
+    # moving away from it, so binary-search OKLCH lightness (hue and chroma
+    # frozen) for the smallest adjustment that meets the ratio, instead of
+    # walking fixed 0.02 steps.
     oklch = fg.to_oklch()
-    bg_light = bg.luminance() < 0.5
-    step = 0.02
-    max_iterations = 50
-
-    for _ in range(max_iterations):
-        if bg_light:
-            oklch = oklch.with_lightness(oklch.lightness + step)
+    lighten = bg.luminance() < 0.5
+    lo, hi = (oklch.lightness, 1.0) if lighten else (0.0, oklch.lightness)
+
+    best = None
+    for _ in range(8):
+        mid = (lo + hi) / 2
+        candidate = oklch.with_lightness(mid).to_rgb()
+        if contrast_ratio(candidate, bg) >= min_ratio:
+            best = candidate
+            if lighten:
+                hi = mid
+            else:
+                lo = mid
         else:
-            oklch = oklch.with_lightness(oklch.lightness - step)
+            if lighten:
+                lo = mid
+            else:
+                hi = mid
 
-        adjusted = oklch.to_rgb()
-        if contrast_ratio(adjusted, bg) >= min_ratio:
-            return adjusted
+    if best is not None:
+        return best
 
     # Return best effort (white or black)
-    return Color(255, 255, 255) if bg_light else Color(0, 0, 0)
+    return Color(255, 255, 255) if lighten else Color(0, 0, 0)
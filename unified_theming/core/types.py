@@ -5,7 +5,7 @@ This module defines all data classes, type aliases, and enumerations
 used throughout the application.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -115,7 +115,7 @@ class ValidationMessage:
         return msg
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of theme validation."""
 
@@ -125,6 +125,24 @@ class ValidationResult:
     messages: List[ValidationMessage] = field(default_factory=list)
     """List of validation messages."""
 
+    errors: InitVar[tuple] = ()
+    """Error message strings to record at construction time."""
+
+    warnings: InitVar[tuple] = ()
+    """Warning message strings to record at construction time."""
+
+    infos: InitVar[tuple] = ()
+    """Informational message strings to record at construction time."""
+
+    def __post_init__(self, errors: tuple, warnings: tuple, infos: tuple) -> None:
+        """Record any messages passed to the constructor."""
+        for message in errors:
+            self.add_error(message)
+        for message in warnings:
+            self.add_warning(message)
+        for message in infos:
+            self.add_info(message)
+
     def add_error(
         self,
         message: str,
@@ -218,7 +236,7 @@ class ThemeData:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class HandlerResult:
     """Result of a single handler's theme application."""
 
@@ -244,7 +262,7 @@ class HandlerResult:
     """Non-fatal warnings during application."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationResult:
     """
     Aggregated result of theme application across all handlers.
@@ -330,7 +348,7 @@ class Backup:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlannedChange:
     """
     Represents a planned change that would be made during theme application.
@@ -360,7 +378,7 @@ class PlannedChange:
     """Toolkit this change affects."""
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanResult:
     """
     Result of planning theme changes (dry-run mode).
@@ -386,15 +404,29 @@ class PlanResult:
     warnings: List[str] = field(default_factory=list)
     """Warnings about the planned operation."""
 
+    changes_by_handler: Dict[str, List[PlannedChange]] = field(
+        init=False, default_factory=dict
+    )
+    """Planned changes grouped by handler name, derived in __post_init__."""
+
     def __post_init__(self) -> None:
         """Calculate derived fields."""
         self.estimated_files_affected = len(
             set(change.file_path for change in self.planned_changes)
         )
 
+        # Group once at construction so consumers (formatters, lookups)
+        # iterate directly instead of re-bucketing the flat list each time.
+        grouped: Dict[str, List[PlannedChange]] = {}
+        for change in self.planned_changes:
+            grouped.setdefault(change.handler_name, []).append(change)
+        for changes in grouped.values():
+            changes.sort(key=lambda c: (c.change_type, str(c.file_path)))
+        self.changes_by_handler = grouped
+
     def get_changes_by_handler(self, handler_name: str) -> List[PlannedChange]:
         """Get all planned changes for a specific handler."""
-        return [c for c in self.planned_changes if c.handler_name == handler_name]
+        return list(self.changes_by_handler.get(handler_name, []))
 
     def get_changes_by_type(self, change_type: str) -> List[PlannedChange]:
         """Get all planned changes of a specific type."""
@@ -6,113 +6,24 @@ validation, and translation between different toolkit color systems.
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 from ..core.exceptions import ColorValidationError
 from ..core.types import ColorFormat
 
-
-def validate_color_format(color_value: str) -> bool:
-    """
-    Validate if a color value is in a valid format.
-
-    Args:
-        color_value: Color value string to validate
-
-    Returns:
-        True if color format is valid, False otherwise
-    """
-    # Normalize the color value
-    original_value = color_value
-    color_value = color_value.strip().lower()
-
-    # Check hex format with value validation
-    hex_match = re.match(r"^#([0-9a-f]{3}|[0-9a-f]{6}|[0-9a-f]{8})$", color_value)
-    if hex_match:
-        return True
-
-    # Check RGB format
-    rgb_match = re.match(r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$", color_value)
-    if rgb_match:
-        r, g, b = [int(x) for x in rgb_match.groups()]
-        # RGB values must be between 0 and 255
-        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
-            return True
-        return False
-
-    # Check RGBA format
-    rgba_match = re.match(
-        r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(0|1|0?\.\d+)\s*\)$",
-        color_value,
-    )
-    if rgba_match:
-        r_str, g_str, b_str, a_str = rgba_match.groups()
-        r, g, b = int(r_str), int(g_str), int(b_str)
-        a = float(a_str)
-        # RGB values must be between 0 and 255, alpha between 0 and 1
-        if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0 <= a <= 1:
-            return True
-        return False
-
-    # Check HSL format
-    hsl_match = re.match(
-        r"hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)$", color_value
-    )
-    if hsl_match:
-        h, s, l = [int(x) for x in hsl_match.groups()]
-        # H value must be 0-360, S and L must be 0-100
-        if 0 <= h <= 360 and 0 <= s <= 100 and 0 <= l <= 100:
-            return True
-        return False
-
-    # Check HSLA format
-    hsla_match = re.match(
-        r"hsla\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*,\s*(0|1|0?\.\d+)\s*\)$",
-        color_value,
-    )
-    if hsla_match:
-        h_str, s_str, l_str, a_str = hsla_match.groups()
-        h, s, l = int(h_str), int(s_str), int(l_str)
-        a = float(a_str)
-        # H value must be 0-360, S and L must be 0-100, alpha must be 0-1
-        if 0 <= h <= 360 and 0 <= s <= 100 and 0 <= l <= 100 and 0 <= a <= 1:
-            return True
-        return False
-
-    # Check for named colors
-    named_colors = {
+# Named-color tables, built once at import time. validate_color_format and
+# the _to_* helpers do a single hash lookup instead of rebuilding literal
+# dict/set objects on every call.
+_NAMED_COLORS = frozenset(
+        {
         "aqua",
         "black",
         "blue",
-        "fuchsia",
-        "gray",
-        "green",
-        "lime",
-        "maroon",
-        "navy",
-        "olive",
-        "purple",
-        "red",
-        "silver",
-        "teal",
-        "white",
-        "yellow",
-        "orange",
-        "pink",
-        "turquoise",
-        "violet",
-        "wheat",
-        "tan",
-        "plum",
         "chocolate",
-        "salmon",
         "coral",
-        "firebrick",
-        "indigo",
-        "gold",
-        "tomato",
-        "cyan",
         "crimson",
+        "cyan",
         "darkblue",
         "darkcyan",
         "darkgoldenrod",
@@ -134,9 +45,13 @@ def validate_color_format(color_value: str) -> bool:
         "deepskyblue",
         "dimgray",
         "dodgerblue",
+        "firebrick",
         "forestgreen",
+        "fuchsia",
+        "gold",
         "goldenrod",
         "gray",
+        "green",
         "indianred",
         "indigo",
         "lavenderblush",
@@ -147,14 +62,23 @@ def validate_color_format(color_value: str) -> bool:
         "lightgray",
         "lightgreen",
         "lightpink",
+        "lime",
         "magenta",
+        "maroon",
         "mediumvioletred",
+        "navy",
+        "olive",
         "olivedrab",
+        "orange",
         "orangered",
         "orchid",
         "palevioletred",
         "peru",
+        "pink",
         "plum",
+        "purple",
+        "rebeccapurple",
+        "red",
         "rosybrown",
         "royalblue",
         "saddlebrown",
@@ -162,20 +86,132 @@ def validate_color_format(color_value: str) -> bool:
         "sandybrown",
         "seagreen",
         "sienna",
+        "silver",
         "skyblue",
         "slateblue",
         "slategray",
         "springgreen",
         "steelblue",
+        "tan",
+        "teal",
+        "tomato",
+        "turquoise",
         "violet",
+        "wheat",
+        "white",
+        "yellow",
         "yellowgreen",
-        "rebeccapurple",
-    }
+        }
+)
+
+_NAMED_TO_HEX = {
+    "black": "#000000",
+    "white": "#FFFFFF",
+    "red": "#FF0000",
+    "green": "#008000",
+    "blue": "#0000FF",
+    "yellow": "#FFFF00",
+    "cyan": "#00FFFF",
+    "magenta": "#FF00FF",
+    "orange": "#FFA500",
+    "purple": "#800080",
+    "brown": "#A52A2A",
+    "pink": "#FFC0CB",
+    "gray": "#808080",
+    "silver": "#C0C0C0",
+    "gold": "#FFD700",
+    "violet": "#EE82EE",
+}
+
+_HEX_TO_NAMED = {hex_val: name for name, hex_val in _NAMED_TO_HEX.items()}
+
+_NAMED_TO_RGB = {
+    name: "rgb({}, {}, {})".format(
+        int(hex_val[1:3], 16), int(hex_val[3:5], 16), int(hex_val[5:7], 16)
+    )
+    for name, hex_val in _NAMED_TO_HEX.items()
+}
+
+
+# Color-string patterns compiled once at import time. Callers dispatch on
+# the first character(s) so a value is only tried against the one pattern
+# family it can match.
+_HEX_RE = re.compile(r"#(?:[0-9a-f]{3}|[0-9a-f]{6}|[0-9a-f]{8})$")
+_RGB_RE = re.compile(r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$", re.IGNORECASE)
+_RGBA_RE = re.compile(
+    r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)$", re.IGNORECASE
+)
+_RGBA_STRICT_RE = re.compile(
+    r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*(0|1|0?\.\d+)\s*\)$"
+)
+_HSL_RE = re.compile(r"hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)$", re.IGNORECASE)
+_HSLA_RE = re.compile(
+    r"hsla\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*,\s*(0|1|0?\.\d+)\s*\)$"
+)
+_GTK_RGBA_RE = re.compile(
+    r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*[\d.]+\s*)?\)", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=2048)
+def validate_color_format(color_value: str) -> bool:
+    """
+    Validate if a color value is in a valid format.
+
+    Args:
+        color_value: Color value string to validate
+
+    Returns:
+        True if color format is valid, False otherwise
+    """
+    color_value = color_value.strip().lower()
+    if not color_value:
+        return False
 
-    if color_value in named_colors:
-        return True
+    # Dispatch on the leading character so only one pattern family is tried.
+    first = color_value[0]
+
+    if first == "#":
+        return _HEX_RE.match(color_value) is not None
+
+    if first == "r":
+        rgb_match = _RGB_RE.match(color_value)
+        if rgb_match:
+            r, g, b = [int(x) for x in rgb_match.groups()]
+            # RGB values must be between 0 and 255
+            return 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255
+
+        rgba_match = _RGBA_STRICT_RE.match(color_value)
+        if rgba_match:
+            r_str, g_str, b_str, a_str = rgba_match.groups()
+            r, g, b = int(r_str), int(g_str), int(b_str)
+            a = float(a_str)
+            # RGB values must be between 0 and 255, alpha between 0 and 1
+            return (
+                0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0 <= a <= 1
+            )
+        # Named colors may also start with "r" (red, royalblue, ...)
+        return color_value in _NAMED_COLORS
+
+    if first == "h":
+        hsl_match = _HSL_RE.match(color_value)
+        if hsl_match:
+            h, s, l = [int(x) for x in hsl_match.groups()]
+            # H value must be 0-360, S and L must be 0-100
+            return 0 <= h <= 360 and 0 <= s <= 100 and 0 <= l <= 100
+
+        hsla_match = _HSLA_RE.match(color_value)
+        if hsla_match:
+            h_str, s_str, l_str, a_str = hsla_match.groups()
+            h, s, l = int(h_str), int(s_str), int(l_str)
+            a = float(a_str)
+            # H value must be 0-360, S and L must be 0-100, alpha must be 0-1
+            return (
+                0 <= h <= 360 and 0 <= s <= 100 and 0 <= l <= 100 and 0 <= a <= 1
+            )
+        return color_value in _NAMED_COLORS
 
-    return False
+    return color_value in _NAMED_COLORS
 
 
 def normalize_color_format(
@@ -199,20 +235,13 @@ def normalize_color_format(
 
     color_value = color_value.strip().lower()
 
-    if target_format == ColorFormat.HEX:
-        return _to_hex(color_value)
-    elif target_format == ColorFormat.RGB:
-        return _to_rgb(color_value)
-    elif target_format == ColorFormat.RGBA:
-        return _to_rgba(color_value)
-    elif target_format == ColorFormat.HSL:
-        return _to_hsl(color_value)
-    elif target_format == ColorFormat.NAMED:
-        return _to_named(color_value)
-    else:
+    converter = _FORMAT_CONVERTERS.get(target_format)
+    if converter is None:
         return color_value  # Return as is for unknown formats
+    return converter(color_value)
 
 
+@lru_cache(maxsize=2048)
 def _to_hex(color_value: str) -> str:
     """Convert color to hex format."""
     color_value = color_value.strip().lower()
@@ -227,65 +256,38 @@ def _to_hex(color_value: str) -> str:
     # If RGB format
     if color_value.startswith("rgb("):
         # Extract RGB values
-        match = re.match(
-            r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color_value, re.IGNORECASE
-        )
+        match = _RGB_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
-            return f"#{r:02x}{g:02x}{b:02x}".upper()
+            # Pack the channels and format once instead of per channel
+            return f"#{r << 16 | g << 8 | b:06X}"
 
     # If RGBA format
     if color_value.startswith("rgba("):
         # Extract RGB values (ignore alpha)
-        match = re.match(
-            r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)",
-            color_value,
-            re.IGNORECASE,
-        )
+        match = _RGBA_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
-            return f"#{r:02x}{g:02x}{b:02x}".upper()
+            return f"#{r << 16 | g << 8 | b:06X}"
 
     # If HSL format
     if color_value.startswith("hsl("):
         # Convert HSL to RGB then to hex
-        match = re.match(
-            r"hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)",
-            color_value,
-            re.IGNORECASE,
-        )
+        match = _HSL_RE.match(color_value)
         if match:
             h, s, l = [int(x) for x in match.groups()]
             r, g, b = hsl_to_rgb(h, s, l)
-            return f"#{r:02x}{g:02x}{b:02x}".upper()
+            return f"#{r << 16 | g << 8 | b:06X}"
 
     # If named color, convert to hex
-    named_colors = {
-        "black": "#000000",
-        "white": "#FFFFFF",
-        "red": "#FF0000",
-        "green": "#008000",
-        "blue": "#0000FF",
-        "yellow": "#FFFF00",
-        "cyan": "#00FFFF",
-        "magenta": "#FF00FF",
-        "orange": "#FFA500",
-        "purple": "#800080",
-        "brown": "#A52A2A",
-        "pink": "#FFC0CB",
-        "gray": "#808080",
-        "silver": "#C0C0C0",
-        "gold": "#FFD700",
-        "violet": "#EE82EE",
-    }
-
-    if color_value in named_colors:
-        return named_colors[color_value]
+    if color_value in _NAMED_TO_HEX:
+        return _NAMED_TO_HEX[color_value]
 
     # If we can't convert, return the original
     return color_value
 
 
+@lru_cache(maxsize=2048)
 def _to_rgb(color_value: str) -> str:
     """Convert color to RGB format."""
     color_value = color_value.strip().lower()
@@ -296,11 +298,7 @@ def _to_rgb(color_value: str) -> str:
 
     # If RGBA format, convert to RGB
     if color_value.startswith("rgba("):
-        match = re.match(
-            r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)",
-            color_value,
-            re.IGNORECASE,
-        )
+        match = _RGBA_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
             return f"rgb({r}, {g}, {b})"
@@ -312,52 +310,31 @@ def _to_rgb(color_value: str) -> str:
             hex_color = f"{hex_color[0]*2}{hex_color[1]*2}{hex_color[2]*2}"
 
         try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return f"rgb({r}, {g}, {b})"
+            # One int() over the packed 6-digit slice, then bit shifts,
+            # instead of three slice-and-parse round trips
+            v = int(hex_color[:6], 16) if len(hex_color) >= 6 else None
         except ValueError:
-            pass
+            v = None
+        if v is not None:
+            return f"rgb({v >> 16}, {(v >> 8) & 0xFF}, {v & 0xFF})"
 
     # If HSL format, convert to RGB
     if color_value.startswith("hsl("):
-        match = re.match(
-            r"hsl\s*\(\s*(\d+)\s*,\s*(\d+)%\s*,\s*(\d+)%\s*\)",
-            color_value,
-            re.IGNORECASE,
-        )
+        match = _HSL_RE.match(color_value)
         if match:
             h, s, l = [int(x) for x in match.groups()]
             r, g, b = hsl_to_rgb(h, s, l)
             return f"rgb({r}, {g}, {b})"
 
     # If named color, convert to RGB
-    named_colors = {
-        "black": "rgb(0, 0, 0)",
-        "white": "rgb(255, 255, 255)",
-        "red": "rgb(255, 0, 0)",
-        "green": "rgb(0, 128, 0)",
-        "blue": "rgb(0, 0, 255)",
-        "yellow": "rgb(255, 255, 0)",
-        "cyan": "rgb(0, 255, 255)",
-        "magenta": "rgb(255, 0, 255)",
-        "orange": "rgb(255, 165, 0)",
-        "purple": "rgb(128, 0, 128)",
-        "brown": "rgb(165, 42, 42)",
-        "pink": "rgb(255, 192, 203)",
-        "gray": "rgb(128, 128, 128)",
-        "silver": "rgb(192, 192, 192)",
-        "gold": "rgb(255, 215, 0)",
-        "violet": "rgb(238, 130, 238)",
-    }
-
-    if color_value in named_colors:
-        return named_colors[color_value]
+    if color_value in _NAMED_TO_RGB:
+        return _NAMED_TO_RGB[color_value]
 
     # If we can't convert, return the original
     return color_value
 
 
+@lru_cache(maxsize=2048)
 def _to_rgba(color_value: str) -> str:
     """Convert color to RGBA format."""
     color_value = color_value.strip().lower()
@@ -368,9 +345,7 @@ def _to_rgba(color_value: str) -> str:
 
     # If RGB format, convert to RGBA with full opacity
     if color_value.startswith("rgb("):
-        match = re.match(
-            r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color_value, re.IGNORECASE
-        )
+        match = _RGB_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
             return f"rgba({r}, {g}, {b}, 1.0)"
@@ -382,21 +357,22 @@ def _to_rgba(color_value: str) -> str:
             hex_color = f"{hex_color[0]*2}{hex_color[1]*2}{hex_color[2]*2}"
         elif len(hex_color) == 8:  # Has alpha
             try:
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                a = int(hex_color[6:8], 16) / 255.0
-                return f"rgba({r}, {g}, {b}, {a:.3f})"
+                v = int(hex_color, 16)
             except ValueError:
                 pass
+            else:
+                a = (v & 0xFF) / 255.0
+                return (
+                    f"rgba({v >> 24}, {(v >> 16) & 0xFF}, {(v >> 8) & 0xFF},"
+                    f" {a:.3f})"
+                )
 
         try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return f"rgba({r}, {g}, {b}, 1.0)"
+            v = int(hex_color[:6], 16) if len(hex_color) >= 6 else None
         except ValueError:
-            pass
+            v = None
+        if v is not None:
+            return f"rgba({v >> 16}, {(v >> 8) & 0xFF}, {v & 0xFF}, 1.0)"
 
     # For other formats, convert to RGB first then RGBA
     rgb = _to_rgb(color_value)
@@ -407,6 +383,7 @@ def _to_rgba(color_value: str) -> str:
     return color_value
 
 
+@lru_cache(maxsize=2048)
 def _to_hsl(color_value: str) -> str:
     """Convert color to HSL format."""
     color_value = color_value.strip().lower()
@@ -422,20 +399,16 @@ def _to_hsl(color_value: str) -> str:
             hex_color = f"{hex_color[0]*2}{hex_color[1]*2}{hex_color[2]*2}"
 
         try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-
-            h, s, l = rgb_to_hsl(r, g, b)
-            return f"hsl({h}, {s}%, {l}%)"
+            v = int(hex_color[:6], 16) if len(hex_color) >= 6 else None
         except ValueError:
-            pass
+            v = None
+        if v is not None:
+            h, s, l = rgb_to_hsl(v >> 16, (v >> 8) & 0xFF, v & 0xFF)
+            return f"hsl({h}, {s}%, {l}%)"
 
     # If RGB format, convert to HSL
     if color_value.startswith("rgb("):
-        match = re.match(
-            r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", color_value, re.IGNORECASE
-        )
+        match = _RGB_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
             h, s, l = rgb_to_hsl(r, g, b)
@@ -443,11 +416,7 @@ def _to_hsl(color_value: str) -> str:
 
     # If RGBA format, convert to HSL (ignore alpha)
     if color_value.startswith("rgba("):
-        match = re.match(
-            r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*,\s*[\d.]+\s*\)",
-            color_value,
-            re.IGNORECASE,
-        )
+        match = _RGBA_RE.match(color_value)
         if match:
             r, g, b = [int(x) for x in match.groups()]
             h, s, l = rgb_to_hsl(r, g, b)
@@ -456,9 +425,7 @@ def _to_hsl(color_value: str) -> str:
     # If named color, convert to HSL
     rgb = _to_rgb(color_value)
     if rgb.startswith("rgb("):
-        match = re.match(
-            r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", rgb, re.IGNORECASE
-        )
+        match = _RGB_RE.match(rgb)
         if match:
             r, g, b = [int(x) for x in match.groups()]
             h, s, l = rgb_to_hsl(r, g, b)
@@ -468,6 +435,7 @@ def _to_hsl(color_value: str) -> str:
     return color_value
 
 
+@lru_cache(maxsize=2048)
 def _to_named(color_value: str) -> str:
     """Convert color to named format (if possible)."""
     color_value = color_value.strip().lower()
@@ -475,33 +443,27 @@ def _to_named(color_value: str) -> str:
     # First convert to hex to identify the color
     hex_color = _to_hex(color_value)
 
-    # Known named colors with their hex values (uppercase)
-    named_colors = {
-        "#000000": "black",
-        "#FFFFFF": "white",
-        "#FF0000": "red",
-        "#008000": "green",
-        "#0000FF": "blue",
-        "#FFFF00": "yellow",
-        "#00FFFF": "cyan",
-        "#FF00FF": "magenta",
-        "#FFA500": "orange",
-        "#800080": "purple",
-        "#A52A2A": "brown",
-        "#FFC0CB": "pink",
-        "#808080": "gray",
-        "#C0C0C0": "silver",
-        "#FFD700": "gold",
-        "#EE82EE": "violet",
-    }
-
-    if hex_color in named_colors:
-        return named_colors[hex_color]
+    # Reverse lookup over the module-level named-color table
+    if hex_color in _HEX_TO_NAMED:
+        return _HEX_TO_NAMED[hex_color]
 
     # If we can't convert, return the original
     return color_value
 
 
+# Target-format dispatch for normalize_color_format. Each converter branches
+# on the source prefix internally and emits the target directly (same-format
+# inputs short-circuit), so every source/target pair takes one fused path
+# with no intermediate representation.
+_FORMAT_CONVERTERS = {
+    ColorFormat.HEX: _to_hex,
+    ColorFormat.RGB: _to_rgb,
+    ColorFormat.RGBA: _to_rgba,
+    ColorFormat.HSL: _to_hsl,
+    ColorFormat.NAMED: _to_named,
+}
+
+
 def hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
     """
     Convert HSL color to RGB.
@@ -514,34 +476,23 @@ def hsl_to_rgb(h: int, s: int, l: int) -> Tuple[int, int, int]:
     Returns:
         Tuple of (r, g, b) values in range 0-255
     """
-    h_norm = h / 360.0
-    s_norm = s / 100.0
-    l_norm = l / 100.0
-
-    if s_norm == 0:
-        r = g = b = l_norm
-    else:
-
-        def hue2rgb(p: float, q: float, t: float) -> float:
-            if t < 0:
-                t += 1
-            if t > 1:
-                t -= 1
-            if t < 1 / 6:
-                return p + (q - p) * 6 * t
-            if t < 1 / 2:
-                return q
-            if t < 2 / 3:
-                return p + (q - p) * (2 / 3 - t) * 6
-            return p
+    # Branchless algebraic form: each channel is a clamped triangle wave of
+    # the hue, scaled by chroma and shifted by lightness. Equivalent to the
+    # classic six-case hue2rgb ladder without its unpredictable branches.
+    h6 = (h % 360) / 60.0
+    r = min(max(abs(h6 - 3) - 1, 0.0), 1.0)
+    g = min(max(2 - abs(h6 - 2), 0.0), 1.0)
+    b = min(max(2 - abs(h6 - 4), 0.0), 1.0)
 
-        q = l_norm * (1 + s_norm) if l_norm < 0.5 else l_norm + s_norm - l_norm * s_norm
-        p = 2 * l_norm - q
-        r = hue2rgb(p, q, h_norm + 1 / 3)
-        g = hue2rgb(p, q, h_norm)
-        b = hue2rgb(p, q, h_norm - 1 / 3)
+    l_norm = l / 100.0
+    c = (1 - abs(2 * l_norm - 1)) * s / 100.0
+    m = l_norm - c / 2
 
-    return round(r * 255), round(g * 255), round(b * 255)
+    return (
+        round((r * c + m) * 255),
+        round((g * c + m) * 255),
+        round((b * c + m) * 255),
+    )
 
 
 def rgb_to_hsl(r: int, g: int, b: int) -> Tuple[int, int, int]:
@@ -594,6 +545,24 @@ def rgb_to_hsl(r: int, g: int, b: int) -> Tuple[int, int, int]:
     return h_result, s_result, l_result
 
 
+# Mapping from GTK to Qt color variables, shared by every translation call.
+_GTK_TO_QT_MAPPING = {
+    "theme_bg_color": "BackgroundNormal",
+    "theme_fg_color": "ForegroundNormal",
+    "theme_base_color": "Base",
+    "theme_text_color": "Text",
+    "theme_selected_bg_color": "Highlight",
+    "theme_selected_fg_color": "HighlightedText",
+    "insensitive_bg_color": "BackgroundInactive",
+    "insensitive_fg_color": "ForegroundInactive",
+    "link_color": "Link",
+    "visited_link_color": "VisitedLink",
+    "success_color": "ForegroundPositive",
+    "warning_color": "ForegroundNeutral",
+    "error_color": "ForegroundNegative",
+}
+
+
 def gtk_to_qt_colors(gtk_colors: Dict[str, str]) -> Dict[str, str]:
     """
     Translate GTK color variables to Qt equivalents.
@@ -604,26 +573,9 @@ def gtk_to_qt_colors(gtk_colors: Dict[str, str]) -> Dict[str, str]:
     Returns:
         Dictionary of Qt color names to values
     """
-    # Mapping from GTK to Qt color variables
-    gtk_to_qt_mapping = {
-        "theme_bg_color": "BackgroundNormal",
-        "theme_fg_color": "ForegroundNormal",
-        "theme_base_color": "Base",
-        "theme_text_color": "Text",
-        "theme_selected_bg_color": "Highlight",
-        "theme_selected_fg_color": "HighlightedText",
-        "insensitive_bg_color": "BackgroundInactive",
-        "insensitive_fg_color": "ForegroundInactive",
-        "link_color": "Link",
-        "visited_link_color": "VisitedLink",
-        "success_color": "ForegroundPositive",
-        "warning_color": "ForegroundNeutral",
-        "error_color": "ForegroundNegative",
-    }
-
     qt_colors = {}
 
-    for gtk_color, qt_color in gtk_to_qt_mapping.items():
+    for gtk_color, qt_color in _GTK_TO_QT_MAPPING.items():
         if gtk_color in gtk_colors:
             try:
                 # Convert GTK color format to Qt format (RGB values)
@@ -637,6 +589,7 @@ def gtk_to_qt_colors(gtk_colors: Dict[str, str]) -> Dict[str, str]:
     return qt_colors
 
 
+@lru_cache(maxsize=2048)
 def gtk_color_to_qt_format(gtk_color: str) -> str:
     """
     Convert a GTK color format to Qt RGB format (r,g,b).
@@ -664,21 +617,17 @@ def gtk_color_to_qt_format(gtk_color: str) -> str:
             )
 
         try:
-            r = int(gtk_color[0:2], 16)
-            g = int(gtk_color[2:4], 16)
-            b = int(gtk_color[4:6], 16)
-            return f"{r},{g},{b}"
+            v = int(gtk_color, 16)
         except ValueError:
             raise ColorValidationError(
                 "unknown", gtk_color, f"Invalid hex color: {gtk_color}"
             )
+        return f"{v >> 16},{(v >> 8) & 0xFF},{v & 0xFF}"
 
     # Handle rgb() format
     elif gtk_color.lower().startswith("rgb("):
         # Extract numbers from rgb(r, g, b)
-        match = re.search(
-            r"rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)", gtk_color, re.IGNORECASE
-        )
+        match = _RGB_RE.match(gtk_color)
         if match:
             r_str, g_str, b_str = match.groups()
             return f"{r_str},{g_str},{b_str}"
@@ -690,11 +639,7 @@ def gtk_color_to_qt_format(gtk_color: str) -> str:
     # Handle rgba() format (ignore alpha)
     elif gtk_color.lower().startswith("rgba("):
         # Extract numbers from rgba(r, g, b, a)
-        match = re.search(
-            r"rgba\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*[\d.]+\s*)?\)",
-            gtk_color,
-            re.IGNORECASE,
-        )
+        match = _GTK_RGBA_RE.match(gtk_color)
         if match:
             r_str, g_str, b_str = match.groups()
             return f"{r_str},{g_str},{b_str}"